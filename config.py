@@ -3,6 +3,7 @@ Ultimate-Trader Configuration
 Cascade: env vars > .env file > defaults
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -43,6 +44,7 @@ CLOB_HOST = "https://clob.polymarket.com"
 GAMMA_HOST = "https://gamma-api.polymarket.com"
 DATA_HOST = "https://data-api.polymarket.com"
 WS_HOST = "wss://ws-live-data.polymarket.com"
+WS_USER_HOST = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
 USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
 
 # ---- Polymarket Auth ----
@@ -106,6 +108,10 @@ TRADES_FILE = DATA_DIR / "trades.json"
 WATCHED_WALLETS_FILE = DATA_DIR / "watched_wallets.json"
 SIM_STATS_FILE = DATA_DIR / "sim_stats.json"
 
+# ---- Persistence ----
+# Write portfolio/wallet JSON from a background thread instead of the event loop
+BACKGROUND_WRITES = _get_bool("BACKGROUND_WRITES", default=True)
+
 
 
 
@@ -130,8 +136,9 @@ def validate() -> list[str]:
     return errors
 
 
+@lru_cache(maxsize=1)
 def summary() -> str:
-    """Returns a human-readable config summary (no secrets)."""
+    """Returns a human-readable config summary (no secrets). Config is fixed at startup."""
     mode = trading_mode()
     mode_desc = {
         "PAPER":   f"PAPER TRADE (${PAPER_STARTING_BALANCE:.0f} virtual USDC)",
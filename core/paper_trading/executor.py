@@ -17,7 +17,7 @@ import uuid
 from typing import Optional
 
 import config as cfg
-from core.paper_trading.wallet import PaperPosition, get_paper_wallet
+from core.paper_trading.wallet import PaperPosition, WalletStats, get_paper_wallet
 from core.polymarket.client import get_client
 
 logger = logging.getLogger(__name__)
@@ -36,7 +36,9 @@ class PaperExecutor:
         self._price_update_task: Optional[asyncio.Task] = None
 
     async def start_price_updates(self):
-        """Start background task to update position prices."""
+        """Start background task to update position prices (idempotent)."""
+        if self._price_update_task and not self._price_update_task.done():
+            return
         self._price_update_task = asyncio.create_task(self._update_prices_loop())
 
     async def stop(self):
@@ -226,7 +228,7 @@ class PaperExecutor:
             "paper": True,
         }
 
-    def get_wallet_stats(self) -> dict:
+    def get_wallet_stats(self) -> WalletStats:
         return self._wallet.get_stats()
 
 
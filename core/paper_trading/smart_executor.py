@@ -5,22 +5,28 @@ Routes BUY/SELL/LIMIT orders to the right execution path based on trading mode:
   DRY_RUN=true      -> log only, no execution
   both false        -> real Polymarket orders
 """
+import asyncio
 import logging
 from typing import Optional
 
 import config as cfg
 from core.polymarket.client import get_client
 from core.paper_trading.executor import get_paper_executor
+from core.paper_trading.wallet import WalletStats
 
 logger = logging.getLogger(__name__)
 
+# Cap on in-flight orders when one executor is shared by every strategy
+MAX_CONCURRENT_ORDERS = 8
+
 
 class SmartExecutor:
     """Single interface for all order execution regardless of trading mode."""
 
-    def __init__(self):
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_ORDERS):
         self._paper = get_paper_executor()
         self._client = get_client()
+        self._order_slots = asyncio.Semaphore(max_concurrent)
 
     async def start(self):
         if cfg.PAPER_TRADE:
@@ -43,17 +49,18 @@ class SmartExecutor:
             logger.info(f"[DRY RUN] BUY ${usdc_amount:.2f} | {market_name[:30]}")
             return {"status": "DRY_RUN", "dry": True}
 
-        if cfg.PAPER_TRADE:
-            return await self._paper.paper_buy(
-                condition_id=condition_id,
-                token_id=token_id,
-                market_name=market_name,
-                outcome=outcome,
-                usdc_amount=usdc_amount,
-                strategy=strategy,
-            )
+        async with self._order_slots:
+            if cfg.PAPER_TRADE:
+                return await self._paper.paper_buy(
+                    condition_id=condition_id,
+                    token_id=token_id,
+                    market_name=market_name,
+                    outcome=outcome,
+                    usdc_amount=usdc_amount,
+                    strategy=strategy,
+                )
 
-        return await self._client.place_market_order(token_id, "BUY", usdc_amount)
+            return await self._client.place_market_order(token_id, "BUY", usdc_amount)
 
     async def sell(
         self,
@@ -65,14 +72,15 @@ class SmartExecutor:
             logger.info(f"[DRY RUN] SELL {position_id}")
             return {"status": "DRY_RUN", "dry": True}
 
-        if cfg.PAPER_TRADE:
-            return await self._paper.paper_sell(
-                position_id=position_id,
-                token_id=token_id,
-                strategy=strategy,
-            )
+        async with self._order_slots:
+            if cfg.PAPER_TRADE:
+                return await self._paper.paper_sell(
+                    position_id=position_id,
+                    token_id=token_id,
+                    strategy=strategy,
+                )
 
-        return await self._client.place_market_order(token_id, "SELL", 0)
+            return await self._client.place_market_order(token_id, "SELL", 0)
 
     async def place_limit(
         self,
@@ -89,21 +97,22 @@ class SmartExecutor:
             logger.info(f"[DRY RUN] LIMIT {side} {shares:.1f}@{price:.3f} | {market_name[:25]}")
             return {"status": "DRY_RUN", "order_id": "dry_limit", "dry": True}
 
-        if cfg.PAPER_TRADE:
-            return await self._paper.paper_limit_order(
-                token_id=token_id,
-                side=side,
-                target_price=price,
-                shares=shares,
-                strategy=strategy,
-                condition_id=condition_id,
-                market_name=market_name,
-                outcome=outcome,
-            )
-
-        return await self._client.place_limit_order(token_id, side, price, shares)
-
-    def get_wallet_stats(self) -> Optional[dict]:
+        async with self._order_slots:
+            if cfg.PAPER_TRADE:
+                return await self._paper.paper_limit_order(
+                    token_id=token_id,
+                    side=side,
+                    target_price=price,
+                    shares=shares,
+                    strategy=strategy,
+                    condition_id=condition_id,
+                    market_name=market_name,
+                    outcome=outcome,
+                )
+
+            return await self._client.place_limit_order(token_id, side, price, shares)
+
+    def get_wallet_stats(self) -> Optional[WalletStats]:
         if cfg.PAPER_TRADE:
             return self._paper.get_wallet_stats()
         return None
@@ -9,14 +9,16 @@ Simulates a real trading account with $50 USDC starting balance.
 
 This gives a realistic performance assessment before going live.
 """
+import asyncio
 import json
 import logging
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 from pathlib import Path
 
 import config as cfg
+from core.storage import write_json
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,19 @@ class PaperTrade:
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+class WalletStats(NamedTuple):
+    """Snapshot of paper wallet metrics (see PaperWallet.get_stats)."""
+    balance: float
+    initial_balance: float
+    unrealized_pnl: float
+    realized_pnl: float
+    total_pnl: float
+    total_return_pct: float
+    open_positions: int
+    trade_count: int
+    win_rate: float
+
+
 class PaperWallet:
     """
     Virtual trading wallet for paper trading simulation.
@@ -94,6 +109,12 @@ class PaperWallet:
         self._positions: dict[str, PaperPosition] = {}
         self._trades: list[PaperTrade] = []
         self._realized_pnl: float = 0.0
+        # Bumped on every trade (and reset); readers compare it to skip unchanged history
+        self.trade_seq = 0
+        # Bumped whenever update_prices moves an open position's price
+        self.prices_version = 0
+        # Set after every trade or price tick; UI screens wait on it instead of polling
+        self.changed = asyncio.Event()
         self._load()
 
     def _load(self):
@@ -117,20 +138,19 @@ class PaperWallet:
 
     def _save(self):
         """Persist wallet state to disk."""
+        self.changed.set()
         try:
-            with open(PAPER_WALLET_FILE, "w") as f:
-                json.dump(
-                    {
-                        "balance": self._balance,
-                        "initial_balance": self._initial_balance,
-                        "realized_pnl": self._realized_pnl,
-                        "positions": {k: asdict(v) for k, v in self._positions.items()},
-                        "trades": [asdict(t) for t in self._trades[-500:]],
-                        "last_updated": datetime.utcnow().isoformat(),
-                    },
-                    f,
-                    indent=2,
-                )
+            write_json(
+                PAPER_WALLET_FILE,
+                {
+                    "balance": self._balance,
+                    "initial_balance": self._initial_balance,
+                    "realized_pnl": self._realized_pnl,
+                    "positions": {k: asdict(v) for k, v in self._positions.items()},
+                    "trades": [asdict(t) for t in self._trades[-500:]],
+                    "last_updated": datetime.utcnow().isoformat(),
+                },
+            )
         except Exception as e:
             logger.error(f"Paper wallet save error: {e}")
 
@@ -205,6 +225,7 @@ class PaperWallet:
             balance_before=balance_before,
             balance_after=self._balance,
         ))
+        self.trade_seq += 1
         self._save()
 
         logger.info(
@@ -249,6 +270,7 @@ class PaperWallet:
         ))
 
         del self._positions[position_id]
+        self.trade_seq += 1
         self._save()
 
         pnl_sign = "+" if realized_pnl >= 0 else ""
@@ -266,9 +288,15 @@ class PaperWallet:
         Args:
             prices: {token_id: current_price}
         """
+        moved = False
         for pos in self._positions.values():
-            if pos.token_id in prices:
-                pos.update_price(prices[pos.token_id])
+            price = prices.get(pos.token_id)
+            if price is not None and price != pos.current_price:
+                pos.update_price(price)
+                moved = True
+        if moved:
+            self.prices_version += 1
+            self.changed.set()
 
     def reset(self, new_balance: float = STARTING_BALANCE):
         """Reset paper wallet to fresh state."""
@@ -277,6 +305,7 @@ class PaperWallet:
         self._positions = {}
         self._trades = []
         self._realized_pnl = 0.0
+        self.trade_seq += 1
         self._save()
         logger.info(f"Paper wallet reset to ${new_balance}")
 
@@ -288,7 +317,8 @@ class PaperWallet:
 
     @property
     def unrealized_pnl(self) -> float:
-        return sum(p.pnl for p in self._positions.values())
+        # list() snapshot: may be read from a worker thread (UI refresh)
+        return sum(p.pnl for p in list(self._positions.values()))
 
     @property
     def realized_pnl(self) -> float:
@@ -328,18 +358,18 @@ class PaperWallet:
                     wins += 1
         return wins / len(sells) * 100 if sells else 0.0
 
-    def get_stats(self) -> dict:
-        return {
-            "balance": self._balance,
-            "initial_balance": self._initial_balance,
-            "unrealized_pnl": self.unrealized_pnl,
-            "realized_pnl": self._realized_pnl,
-            "total_pnl": self.total_pnl,
-            "total_return_pct": self.total_return_pct,
-            "open_positions": len(self._positions),
-            "trade_count": self.trade_count,
-            "win_rate": self.win_rate,
-        }
+    def get_stats(self) -> WalletStats:
+        return WalletStats(
+            balance=self._balance,
+            initial_balance=self._initial_balance,
+            unrealized_pnl=self.unrealized_pnl,
+            realized_pnl=self._realized_pnl,
+            total_pnl=self.total_pnl,
+            total_return_pct=self.total_return_pct,
+            open_positions=len(self._positions),
+            trade_count=self.trade_count,
+            win_rate=self.win_rate,
+        )
 
     def get_recent_trades(self, limit: int = 50) -> list[PaperTrade]:
         return list(reversed(self._trades[-limit:]))
@@ -7,6 +7,7 @@ Based on patterns from:
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from functools import lru_cache
 from typing import Optional
@@ -22,6 +23,9 @@ SIG_TYPE_EOA = 0
 SIG_TYPE_POLY_PROXY = 1
 SIG_TYPE_GNOSIS_SAFE = 2
 
+# get_markets responses are shared between callers for this long
+MARKETS_TTL = 2.0
+
 
 class PolymarketClient:
     """
@@ -33,6 +37,10 @@ class PolymarketClient:
         self._session: Optional[aiohttp.ClientSession] = None
         self._clob = None
         self._initialized = False
+        # (offset, order) -> (fetched_at, requested_limit, markets)
+        self._markets_cache: dict[tuple, tuple[float, int, list[dict]]] = {}
+        # (offset, order) -> (requested_limit, task) for fetches in flight
+        self._markets_inflight: dict[tuple, tuple[int, asyncio.Task]] = {}
 
     async def initialize(self):
         """Initialize CLOB client with credentials."""
@@ -99,7 +107,33 @@ class PolymarketClient:
         active: bool = True,
         order: str = "volume",
     ) -> list[dict]:
-        """Fetch LIVE open markets from Gamma API sorted by volume."""
+        """
+        Fetch LIVE open markets from Gamma API sorted by volume.
+        Responses are cached for MARKETS_TTL and a larger cached or in-flight
+        request also serves smaller limits, so screens polling together share one call.
+        """
+        key = (offset, order)
+        hit = self._markets_cache.get(key)
+        # A shorter-than-requested response means the listing is exhausted: it covers any limit
+        if hit and time.monotonic() - hit[0] < MARKETS_TTL and (hit[1] >= limit or len(hit[2]) < hit[1]):
+            return hit[2][:limit]
+        pending = self._markets_inflight.get(key)
+        if pending and pending[0] >= limit:
+            return (await asyncio.shield(pending[1]) or [])[:limit]
+
+        task = asyncio.ensure_future(self._fetch_markets(limit, offset, order))
+        self._markets_inflight[key] = (limit, task)
+        try:
+            data = await asyncio.shield(task)
+        finally:
+            if self._markets_inflight.get(key, (0, None))[1] is task:
+                del self._markets_inflight[key]
+        if data is None:
+            return []
+        self._markets_cache[key] = (time.monotonic(), limit, data)
+        return data[:limit]
+
+    async def _fetch_markets(self, limit: int, offset: int, order: str) -> Optional[list[dict]]:
         await self._ensure_session()
         try:
             today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
@@ -120,7 +154,7 @@ class PolymarketClient:
                 logger.warning(f"Markets fetch HTTP {resp.status}: {await resp.text()}")
         except Exception as e:
             logger.warning(f"Markets fetch failed: {e}")
-        return []
+        return None
 
     async def get_market(self, condition_id: str) -> Optional[dict]:
         """Get single market by condition ID."""
@@ -251,20 +285,49 @@ class PolymarketClient:
             )
             return {"status": "DRY_RUN", "order_id": f"dry_{token_id[:8]}_{side}", "dry": True}
 
+        signed_order = await self.sign_limit_order(token_id, side, price, size, expiration)
+        if signed_order is None:
+            return None
+        return await self.post_signed_order(signed_order)
+
+    async def sign_limit_order(
+        self,
+        token_id: str,
+        side: str,
+        price: float,
+        size: float,
+        expiration: int = 0,
+    ):
+        """
+        Build and sign a GTC limit order without posting it.
+        Lets latency-sensitive paths sign ahead of time and only post on trigger.
+        """
+        if cfg.DRY_RUN:
+            return None
+
         if not self._initialized:
             await self.initialize()
 
         try:
-            from py_clob_client.clob_types import LimitOrderArgs, OrderType
+            from py_clob_client.clob_types import OrderArgs
 
-            order_args = LimitOrderArgs(
+            order_args = OrderArgs(
                 token_id=token_id,
                 price=price,
                 size=size,
                 side=side,
                 expiration=expiration,
             )
-            signed_order = self._clob.create_order(order_args)
+            return self._clob.create_order(order_args)
+        except Exception as e:
+            logger.error(f"Limit order signing failed: {e}")
+            return None
+
+    async def post_signed_order(self, signed_order) -> Optional[dict]:
+        """Post an order previously built by sign_limit_order()."""
+        try:
+            from py_clob_client.clob_types import OrderType
+
             resp = self._clob.post_order(signed_order, OrderType.GTC)
             logger.info(f"Limit order placed: {resp}")
             return resp
@@ -288,6 +351,24 @@ class PolymarketClient:
             logger.error(f"Cancel order failed: {e}")
             return False
 
+    async def cancel_orders(self, order_ids: list[str]) -> bool:
+        """Cancel several open orders in a single batch request."""
+        if not order_ids:
+            return True
+        if cfg.DRY_RUN:
+            logger.info(f"[DRY RUN] Cancel {len(order_ids)} orders")
+            return True
+
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            resp = self._clob.cancel_orders(order_ids)
+            return bool(resp)
+        except Exception as e:
+            logger.error(f"Batch cancel failed: {e}")
+            return False
+
     async def cancel_all_orders(self) -> bool:
         """Cancel all open orders."""
         if cfg.DRY_RUN:
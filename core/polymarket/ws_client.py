@@ -33,9 +33,21 @@ class PolymarketWSClient:
     - Message deduplication (last 500 trade IDs, from polymarket-terminal)
     """
 
-    def __init__(self, on_message: Callable[[dict], None]):
+    def __init__(
+        self,
+        on_message: Callable[[dict], None],
+        url: str = cfg.WS_HOST,
+        dedup: bool = True,
+        on_connect: Optional[Callable[[], None]] = None,
+    ):
         self._on_message = on_message
+        # Called after every (re)connect: messages sent while down are not replayed
+        self._on_connect = on_connect
+        self._url = url
+        self._dedup = dedup
         self._ws = None
+        # Tracked ourselves: connection objects differ across websockets versions
+        self._connected = False
         self._running = False
         self._reconnect_attempt = 0
         self._processed_ids: deque = deque(maxlen=500)  # dedup last 500
@@ -57,6 +69,17 @@ class PolymarketWSClient:
             "assets_ids": asset_ids,
         })
 
+    def subscribe_user(self):
+        """Subscribe to order/trade events for our own account (CLOB user channel)."""
+        self._subscriptions.append({
+            "type": "user",
+            "auth": {
+                "apiKey": cfg.API_KEY,
+                "secret": cfg.API_SECRET,
+                "passphrase": cfg.API_PASSPHRASE,
+            },
+        })
+
     async def connect(self):
         """Start WebSocket connection in background."""
         self._running = True
@@ -91,28 +114,38 @@ class PolymarketWSClient:
     async def _connect_and_listen(self):
         """Connect and process messages until disconnection."""
         async with websockets.connect(
-            cfg.WS_HOST,
+            self._url,
             ping_interval=PING_INTERVAL,
             ping_timeout=10,
             close_timeout=5,
         ) as ws:
             self._ws = ws
             logger.info("WebSocket connected to Polymarket")
-
-            # Send all subscriptions
-            for sub in self._subscriptions:
-                await ws.send(json.dumps(sub))
-                logger.debug(f"Subscribed: {sub}")
-
-            # Listen for messages
-            async for raw_msg in ws:
-                if not self._running:
-                    break
-                try:
-                    msg = json.loads(raw_msg)
-                    await self._handle_message(msg)
-                except json.JSONDecodeError:
-                    pass
+            try:
+                # Send all subscriptions
+                for sub in self._subscriptions:
+                    await ws.send(json.dumps(sub))
+                    logger.debug(f"Subscribed: {sub}")
+                self._connected = True
+                if self._on_connect:
+                    try:
+                        self._on_connect()
+                    except Exception as e:
+                        logger.error(f"Error in WS connect handler: {e}")
+
+                # Listen for messages
+                async for raw_msg in ws:
+                    if not self._running:
+                        break
+                    try:
+                        msg = json.loads(raw_msg)
+                    except json.JSONDecodeError:
+                        continue
+                    # The CLOB channels batch events into JSON arrays
+                    for m in (msg if isinstance(msg, list) else (msg,)):
+                        await self._handle_message(m)
+            finally:
+                self._connected = False
 
     async def _handle_message(self, msg: dict):
         """
@@ -123,11 +156,12 @@ class PolymarketWSClient:
             return
 
         # Extract trade ID for deduplication
-        trade_id = msg.get("id") or msg.get("trade_id") or msg.get("taker_order_id")
-        if trade_id:
-            if trade_id in self._processed_ids:
-                return
-            self._processed_ids.append(trade_id)
+        if self._dedup:
+            trade_id = msg.get("id") or msg.get("trade_id") or msg.get("taker_order_id")
+            if trade_id:
+                if trade_id in self._processed_ids:
+                    return
+                self._processed_ids.append(trade_id)
 
         # Route to callback
         try:
@@ -137,7 +171,7 @@ class PolymarketWSClient:
 
     @property
     def is_connected(self) -> bool:
-        return self._ws is not None and not self._ws.closed
+        return self._connected
 
 
 class ActivityWatcher:
@@ -172,3 +206,28 @@ class ActivityWatcher:
 
     async def stop(self):
         await self._ws.disconnect()
+
+
+class UserOrderWatcher:
+    """
+    Streams order and trade events for our own account from the CLOB user
+    channel, so strategies see fills as they happen instead of polling
+    get_open_orders. Keep-alive is handled by the websocket ping loop.
+    """
+
+    def __init__(self, on_event: Callable[[dict], None], on_connect: Optional[Callable[[], None]] = None):
+        """`on_connect` runs after every (re)connect, so callers can reconcile missed events."""
+        # Order updates reuse the order ID as "id", so dedup would drop them
+        self._ws = PolymarketWSClient(on_event, url=cfg.WS_USER_HOST, dedup=False, on_connect=on_connect)
+        self._ws.subscribe_user()
+
+    async def start(self):
+        await self._ws.connect()
+        logger.info("Watching user order stream")
+
+    async def stop(self):
+        await self._ws.disconnect()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._ws.is_connected
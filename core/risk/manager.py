@@ -60,6 +60,18 @@ class RiskManager:
         if self._portfolio.total_invested + amount_usdc > cfg.MAX_POSITION_USDC * cfg.MAX_OPEN_POSITIONS:
             raise RiskError("Total capital at risk limit exceeded")
 
+    def headroom(self) -> float:
+        """
+        Largest new position check_new_position could accept right now.
+        Cheap (cached portfolio aggregates) - use to pre-reject on hot paths.
+        """
+        if self._portfolio.open_position_count >= cfg.MAX_OPEN_POSITIONS:
+            return 0.0
+        if self._portfolio.daily_pnl < -cfg.DAILY_LOSS_LIMIT:
+            return 0.0
+        remaining = cfg.MAX_POSITION_USDC * cfg.MAX_OPEN_POSITIONS - self._portfolio.total_invested
+        return max(0.0, min(cfg.MAX_POSITION_USDC, remaining))
+
     def calculate_position_size(
         self,
         available_usdc: float,
@@ -114,7 +126,7 @@ class RiskManager:
     def get_status(self) -> dict:
         stats = self._portfolio.get_stats()
         return {
-            **stats,
+            **stats._asdict(),
             "daily_limit": cfg.DAILY_LOSS_LIMIT,
             "max_position": cfg.MAX_POSITION_USDC,
             "dry_run": cfg.DRY_RUN,
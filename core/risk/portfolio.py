@@ -3,16 +3,26 @@ Portfolio State Manager
 JSON-based persistence (from polymarket-terminal/src/services/position.js)
 Data structures inspired by nautilus_trader/adapters/polymarket/schemas/
 """
+import asyncio
 import json
 import logging
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from typing import NamedTuple, Optional
 
 import config as cfg
+from core.storage import write_json
 
 logger = logging.getLogger(__name__)
 
+# Write-behind: persist at most every FLUSH_INTERVAL s, or at once after FLUSH_BATCH changes
+FLUSH_INTERVAL = 0.1
+FLUSH_BATCH = 50
+# Trades kept in memory and on disk (older ones only live on in the count)
+TRADES_KEEP = 1000
+
 
 @dataclass
 class MarketPosition:
@@ -59,6 +69,16 @@ class TradeRecord:
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+class PortfolioStats(NamedTuple):
+    """Snapshot of portfolio metrics (see Portfolio.get_stats)."""
+    open_positions: int
+    total_invested: float
+    daily_pnl: float
+    total_pnl: float
+    win_rate: float
+    total_trades: int
+
+
 class Portfolio:
     """
     Manages positions and trade history with JSON persistence.
@@ -67,9 +87,20 @@ class Portfolio:
 
     def __init__(self):
         self._positions: dict[str, MarketPosition] = {}
-        self._trades: list[TradeRecord] = []
+        self._trades: deque[TradeRecord] = deque(maxlen=TRADES_KEEP)  # newest first
+        self._trade_count = 0
+        # Bumped on every recorded trade; readers compare it to skip unchanged history
+        self.trade_seq = 0
         self._daily_pnl: float = 0.0
         self._total_pnl: float = 0.0
+        # Bumped on every position change; tags the lazily computed open stats
+        self._positions_version = 0
+        # (version, open_count, total_invested); valid only while version matches
+        self._open_stats: Optional[tuple[int, int, float]] = None
+        self._pending_writes = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        # Set on every state change; UI screens wait on it instead of polling
+        self.changed = asyncio.Event()
         self._load()
 
     def _load(self):
@@ -83,7 +114,9 @@ class Portfolio:
             if cfg.TRADES_FILE.exists():
                 with open(cfg.TRADES_FILE) as f:
                     data = json.load(f)
-                    self._trades = [TradeRecord(**t) for t in data.get("trades", [])]
+                    # File is oldest-first
+                    self._trades.extendleft(TradeRecord(**t) for t in data.get("trades", []))
+                    self._trade_count = len(self._trades)
                     self._daily_pnl = data.get("daily_pnl", 0.0)
                     self._total_pnl = data.get("total_pnl", 0.0)
             logger.info(
@@ -94,24 +127,47 @@ class Portfolio:
             logger.warning(f"Portfolio load error (starting fresh): {e}")
 
     def _save(self):
+        """
+        Schedule persistence. State changes apply in memory immediately; the
+        disk snapshot is written behind so trade paths never wait on it.
+        """
+        self.changed.set()
+        self._pending_writes += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()  # no event loop (startup/scripts): write now
+            return
+        if self._pending_writes >= FLUSH_BATCH:
+            self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(FLUSH_INTERVAL)
+        self.flush()
+
+    def flush(self):
+        """Write any pending changes to disk now (also call on shutdown)."""
+        if self._pending_writes:
+            self._pending_writes = 0
+            self._write()
+
+    def _write(self):
         """Persist state to disk."""
         try:
-            with open(cfg.POSITIONS_FILE, "w") as f:
-                json.dump(
-                    {k: asdict(v) for k, v in self._positions.items()},
-                    f,
-                    indent=2,
-                )
-            with open(cfg.TRADES_FILE, "w") as f:
-                json.dump(
-                    {
-                        "trades": [asdict(t) for t in self._trades[-1000:]],
-                        "daily_pnl": self._daily_pnl,
-                        "total_pnl": self._total_pnl,
-                    },
-                    f,
-                    indent=2,
-                )
+            write_json(
+                cfg.POSITIONS_FILE,
+                {k: asdict(v) for k, v in self._positions.items()},
+            )
+            write_json(
+                cfg.TRADES_FILE,
+                {
+                    "trades": [asdict(t) for t in reversed(self._trades)],
+                    "daily_pnl": self._daily_pnl,
+                    "total_pnl": self._total_pnl,
+                },
+            )
         except Exception as e:
             logger.error(f"Portfolio save error: {e}")
 
@@ -119,6 +175,7 @@ class Portfolio:
 
     def add_position(self, position: MarketPosition):
         self._positions[position.position_id] = position
+        self._positions_version += 1
         self._save()
         logger.info(
             f"Position added: {position.market_name} {position.outcome} "
@@ -132,6 +189,7 @@ class Portfolio:
                 if hasattr(pos, k):
                     setattr(pos, k, v)
             pos.updated_at = datetime.utcnow().isoformat()
+            self._positions_version += 1
             self._save()
 
     def close_position(self, position_id: str, close_price: float):
@@ -142,12 +200,19 @@ class Portfolio:
             self._daily_pnl += pos.pnl
             self._total_pnl += pos.pnl
             del self._positions[position_id]
+            self._positions_version += 1
             self._save()
             return pos.pnl
         return 0.0
 
+    # Read-only getters may run in a worker thread (UI refresh): iterate over
+    # list() snapshots so concurrent adds/removes on the loop can't break them.
+
+    def get_position(self, position_id: str) -> Optional[MarketPosition]:
+        return self._positions.get(position_id)
+
     def get_open_positions(self) -> list[MarketPosition]:
-        return [p for p in self._positions.values() if p.status == "open"]
+        return [p for p in list(self._positions.values()) if p.status == "open"]
 
     def get_positions_by_strategy(self, strategy: str) -> list[MarketPosition]:
         return [p for p in self._positions.values() if p.strategy == strategy]
@@ -155,21 +220,39 @@ class Portfolio:
     # ---- Trades ----
 
     def record_trade(self, trade: TradeRecord):
-        self._trades.append(trade)
+        self._trades.appendleft(trade)
+        self._trade_count += 1
+        self.trade_seq += 1
         self._save()
 
-    def get_recent_trades(self, limit: int = 50) -> list[TradeRecord]:
-        return self._trades[-limit:]
+    def get_recent_trades(self, limit: int = 50) -> tuple[TradeRecord, ...]:
+        """Most recent trades, newest first."""
+        return tuple(islice(self._trades, limit))
 
     # ---- Metrics ----
 
+    def _get_open_stats(self) -> tuple[int, float]:
+        # May run in a worker thread: the version is read before the snapshot, so a
+        # result computed across a concurrent change is stored under the old version
+        # and never served
+        version = self._positions_version
+        cached = self._open_stats
+        if cached is None or cached[0] != version:
+            open_positions = self.get_open_positions()
+            cached = self._open_stats = (
+                version,
+                len(open_positions),
+                sum(p.total_cost for p in open_positions),
+            )
+        return cached[1], cached[2]
+
     @property
     def open_position_count(self) -> int:
-        return len([p for p in self._positions.values() if p.status == "open"])
+        return self._get_open_stats()[0]
 
     @property
     def total_invested(self) -> float:
-        return sum(p.total_cost for p in self._positions.values() if p.status == "open")
+        return self._get_open_stats()[1]
 
     @property
     def daily_pnl(self) -> float:
@@ -181,7 +264,7 @@ class Portfolio:
 
     @property
     def win_rate(self) -> float:
-        closed = [t for t in self._trades if t.side == "SELL"]
+        closed = [t for t in list(self._trades) if t.side == "SELL"]
         if not closed:
             return 0.0
         wins = sum(1 for t in closed if t.total > 0)
@@ -191,15 +274,15 @@ class Portfolio:
         self._daily_pnl = 0.0
         self._save()
 
-    def get_stats(self) -> dict:
-        return {
-            "open_positions": self.open_position_count,
-            "total_invested": self.total_invested,
-            "daily_pnl": self.daily_pnl,
-            "total_pnl": self.total_pnl,
-            "win_rate": self.win_rate,
-            "total_trades": len(self._trades),
-        }
+    def get_stats(self) -> PortfolioStats:
+        return PortfolioStats(
+            open_positions=self.open_position_count,
+            total_invested=self.total_invested,
+            daily_pnl=self.daily_pnl,
+            total_pnl=self.total_pnl,
+            win_rate=self.win_rate,
+            total_trades=self._trade_count,
+        )
 
 
 # Singleton
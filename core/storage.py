@@ -0,0 +1,84 @@
+"""
+Background State Writer
+Keeps JSON persistence off the asyncio event loop.
+
+Callers serialize a snapshot and hand over the bytes; a single daemon thread
+writes them out atomically (tmp file + os.replace). Bursts of saves to the same
+file coalesce - only the newest snapshot per path is written.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import config as cfg
+
+logger = logging.getLogger(__name__)
+
+
+def _write_atomic(path: Path, data: bytes):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.error(f"State write failed for {path.name}: {e}")
+
+
+class BackgroundWriter:
+    """Single writer thread with latest-wins coalescing per file."""
+
+    def __init__(self):
+        self._pending: dict[Path, bytes] = {}
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="state-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, path: Path, data: bytes):
+        """Queue a snapshot for `path`, replacing any not-yet-written one."""
+        with self._cond:
+            self._pending[path] = data
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every queued snapshot is on disk (or timeout)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: bool(self._pending))
+                batch, self._pending = self._pending, {}
+                self._busy = True
+            for path, data in batch.items():
+                _write_atomic(path, data)
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+
+def write_json(path: Path, obj) -> None:
+    """Persist `obj` as indented JSON, in the background when enabled."""
+    data = json.dumps(obj, indent=2).encode()
+    if cfg.BACKGROUND_WRITES:
+        get_writer().submit(path, data)
+    else:
+        _write_atomic(path, data)
+
+
+# Singleton
+_writer: Optional[BackgroundWriter] = None
+
+
+def get_writer() -> BackgroundWriter:
+    global _writer
+    if _writer is None:
+        _writer = BackgroundWriter()
+    return _writer
@@ -18,9 +18,6 @@ from typing import Optional
 
 import config as cfg
 from core.analysis.price_feed import get_price_feed, SYMBOL_MAP
-from core.notifications import get_notifier
-from core.paper_trading.smart_executor import SmartExecutor
-from core.polymarket.client import get_client
 from core.strategies.base import BaseStrategy
 
 logger = logging.getLogger(__name__)
@@ -55,12 +52,9 @@ class AutoPosition:
 
 class AutoTrader(BaseStrategy):
 
-    def __init__(self):
-        super().__init__("AutoTrader")
-        self._client = get_client()
+    def __init__(self, **services):
+        super().__init__("AutoTrader", **services)
         self._feed = get_price_feed()
-        self._executor = SmartExecutor()
-        self._notifier = get_notifier()
         self._positions: list[AutoPosition] = []
         self._traded_ids: set = set()
         self._scan_count = 0
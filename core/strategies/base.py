@@ -7,37 +7,75 @@ from abc import ABC, abstractmethod
 from typing import Callable, Optional
 
 import config as cfg
-from core.polymarket.client import get_client
+from core.notifications import TelegramNotifier, get_notifier
+from core.paper_trading.smart_executor import SmartExecutor
+from core.polymarket.client import PolymarketClient, get_client
 from core.risk.manager import get_risk_manager
 from core.risk.portfolio import get_portfolio
 
 logger = logging.getLogger(__name__)
 
+YES_KEYS = frozenset(("YES", "UP"))
+NO_KEYS = frozenset(("NO", "DOWN"))
+
+
+def split_outcome_tokens(tokens: list[dict]) -> tuple[Optional[str], Optional[str]]:
+    """Return (yes_token_id, no_token_id) from a market's outcome token list."""
+    lookup = {
+        (t.get("outcome") or t.get("name", "")).upper(): (t.get("token_id") or t.get("id", ""))
+        for t in tokens
+    }
+    yes_tok = next((tid for out, tid in lookup.items() if any(k in out for k in YES_KEYS)), None)
+    no_tok = next((tid for out, tid in lookup.items()
+                   if not any(k in out for k in YES_KEYS) and any(k in out for k in NO_KEYS)), None)
+    return yes_tok, no_tok
+
 
 class BaseStrategy(ABC):
     """
     Abstract base for all trading strategies.
-    Provides common infrastructure: client, portfolio, risk manager, event bus.
+    Provides common infrastructure: client, executor, notifier, portfolio,
+    risk manager, event bus. Pass executor/notifier/client to share one
+    instance across strategies; the executor is then owned (started/stopped)
+    by the caller.
     """
 
-    def __init__(self, name: str):
+    def __init__(
+        self,
+        name: str,
+        executor: Optional[SmartExecutor] = None,
+        notifier: Optional[TelegramNotifier] = None,
+        client: Optional[PolymarketClient] = None,
+    ):
         self.name = name
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._alerts: list[Callable[[str, str], None]] = []  # (level, message)
-        self._client = get_client()
+        self._alerts_tuple: tuple[Callable[[str, str], None], ...] = ()
+        self._client = client or get_client()
+        self._executor = executor or SmartExecutor()
+        self._notifier = notifier or get_notifier()
         self._portfolio = get_portfolio()
         self._risk = get_risk_manager()
 
     def add_alert_handler(self, handler: Callable[[str, str], None]):
         """Register a callback for strategy alerts (used by TUI)."""
         self._alerts.append(handler)
+        # Snapshot for emit_alert: cheaper to iterate, safe against mutation
+        self._alerts_tuple = tuple(self._alerts)
 
-    def emit_alert(self, level: str, message: str):
-        """Send an alert to all registered handlers."""
-        for handler in self._alerts:
+    def emit_alert(self, level: str, template: str, *args, **kwargs):
+        """
+        Send an alert to all registered handlers. With args/kwargs, `template`
+        is str.format-ed - only when a handler is registered to receive it.
+        """
+        if not self._alerts_tuple:
+            return
+        message = template.format(*args, **kwargs) if args or kwargs else template
+        msg = f"[{self.name}] {message}"
+        for handler in self._alerts_tuple:
             try:
-                handler(level, f"[{self.name}] {message}")
+                handler(level, msg)
             except Exception:
                 pass
 
@@ -3,27 +3,61 @@ Copy Trader Strategy - with Paper Trading + Telegram support
 """
 import asyncio
 import logging
+import time
 import uuid
-from collections import deque
+from typing import NamedTuple, Optional
 
 import config as cfg
-from core.notifications import get_notifier
-from core.paper_trading.smart_executor import SmartExecutor
 from core.polymarket.ws_client import ActivityWatcher
-from core.risk.manager import RiskError, get_risk_manager
-from core.risk.portfolio import TradeRecord, get_portfolio
+from core.risk.manager import RiskError
+from core.risk.portfolio import TradeRecord
 from core.strategies.base import BaseStrategy
 
 logger = logging.getLogger(__name__)
 
+# Bound on buffered watcher trades; oldest are dropped when the consumer lags
+TRADE_QUEUE_MAX = 1000
+# Overflow is reported at most this often (s), with the count dropped since
+DROP_REPORT_INTERVAL = 10.0
+
+
+class CopyTradeMsg(NamedTuple):
+    """Fields of an activity-stream trade that the copy path needs."""
+    condition_id: str
+    token_id: str
+    price: float
+    size: float
+
+
+def _parse_trade(msg: dict) -> Optional[CopyTradeMsg]:
+    """Single-pass parse of a watched trade; None for anything we don't copy."""
+    if msg.get("side", "").upper() != "BUY":
+        return None
+    condition_id = msg.get("condition_id") or msg.get("market", "")
+    token_id = msg.get("asset_id") or msg.get("token_id", "")
+    if not condition_id or not token_id:
+        return None
+    try:
+        price = float(msg.get("price") or 0)
+        size = float(msg.get("size") or 0)
+    except (TypeError, ValueError):
+        return None
+    if price <= 0:
+        return None
+    return CopyTradeMsg(condition_id, token_id, price, size)
+
 
 class CopyTrader(BaseStrategy):
-    def __init__(self):
-        super().__init__("CopyTrader")
-        self._executor = SmartExecutor()
-        self._notifier = get_notifier()
+    def __init__(self, **services):
+        super().__init__("CopyTrader", **services)
         self._watcher = None
-        self._trade_queue = asyncio.Queue()
+        self._trade_queue: asyncio.Queue = asyncio.Queue(maxsize=TRADE_QUEUE_MAX)
+        self._dropped = 0
+        self._drop_reported_at = 0.0
+        # Config is fixed for the process lifetime; snapshot hot-path values
+        self._copy_size_frac = cfg.COPY_SIZE_PERCENT / 100
+        self._max_pos = cfg.MAX_POSITION_USDC
+        self._auto_sell_profit = cfg.COPY_AUTO_SELL_PROFIT
 
     async def on_start(self):
         await self._executor.start()
@@ -33,37 +67,51 @@ class CopyTrader(BaseStrategy):
             return
         self._watcher = ActivityWatcher(
             target_address=cfg.COPY_TRADER_ADDRESS,
-            on_trade=lambda msg: self._trade_queue.put_nowait(msg),
+            on_trade=self._enqueue,
         )
         await self._watcher.start()
         self.emit_alert("success", f"[{self._executor.mode}] Watching {cfg.COPY_TRADER_ADDRESS[:12]}...")
 
     async def on_stop(self):
-        await self._executor.stop()
         if self._watcher:
             await self._watcher.stop()
 
+    def _enqueue(self, msg: dict):
+        """Watcher callback: buffer a trade, dropping the oldest when full."""
+        try:
+            self._trade_queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            try:
+                self._trade_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self._trade_queue.put_nowait(msg)
+            self._dropped += 1
+            now = time.monotonic()
+            if now - self._drop_reported_at >= DROP_REPORT_INTERVAL:
+                self.emit_alert("warning", "Trade queue overflow, dropped {} oldest", self._dropped)
+                self._dropped = 0
+                self._drop_reported_at = now
+
     async def run_once(self):
         try:
             msg = await asyncio.wait_for(self._trade_queue.get(), timeout=1.0)
-            await self._process_trade(msg)
         except asyncio.TimeoutError:
-            pass
-
-    async def _process_trade(self, msg: dict):
-        side = msg.get("side", "").upper()
-        if side != "BUY":
             return
-        condition_id = msg.get("condition_id") or msg.get("market", "")
-        token_id = msg.get("asset_id") or msg.get("token_id", "")
-        original_price = float(msg.get("price", 0))
-        original_size = float(msg.get("size", 0))
-        if not condition_id or not token_id or original_price <= 0:
+        parsed = _parse_trade(msg)
+        if parsed is None:
             return
+        await self._process_trade(parsed)
+
+    async def _process_trade(self, trade: CopyTradeMsg):
+        condition_id, token_id, original_price, original_size = trade
         our_usdc = max(0.10, min(
-            original_price * original_size * (cfg.COPY_SIZE_PERCENT / 100),
-            cfg.MAX_POSITION_USDC,
+            original_price * original_size * self._copy_size_frac,
+            self._max_pos,
         ))
+        if our_usdc > self._risk.headroom():
+            self.emit_alert("warning", f"Risk block: no headroom for ${our_usdc:.2f}")
+            return
         try:
             self._risk.check_new_position(our_usdc, condition_id)
         except RiskError as e:
@@ -82,7 +130,7 @@ class CopyTrader(BaseStrategy):
         exec_price = resp.get("price", original_price)
         shares = our_usdc / max(exec_price, 0.001)
         self._notifier.trade_opened("copy", market_name, "BUY", exec_price, our_usdc, paper=cfg.PAPER_TRADE)
-        sell_price = self._risk.calculate_sell_price(exec_price, cfg.COPY_AUTO_SELL_PROFIT)
+        sell_price = self._risk.calculate_sell_price(exec_price, self._auto_sell_profit)
         await self._executor.place_limit(
             token_id=token_id, side="SELL", price=sell_price, shares=shares,
             strategy="copy", condition_id=condition_id, market_name=market_name, outcome="YES",
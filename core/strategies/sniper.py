@@ -2,107 +2,345 @@
 Orderbook Sniper Strategy - with Paper Trading + Telegram support
 Standing low-price buy orders waiting for panic sellers.
 """
-import asyncio, logging, math, time, uuid
+import asyncio, logging, sys, time, uuid
+from typing import Optional
 import config as cfg
-from core.notifications import get_notifier
-from core.paper_trading.smart_executor import SmartExecutor
-from core.risk.portfolio import TradeRecord, get_portfolio
-from core.strategies.base import BaseStrategy
+from core.polymarket.ws_client import UserOrderWatcher
+from core.risk.portfolio import MarketPosition, TradeRecord
+from core.strategies.base import BaseStrategy, split_outcome_tokens
 
 logger = logging.getLogger(__name__)
 SLOT = 300
 BUFFER = 30
+# Max sleep while something still needs polling (fill fallback, unresolved markets)
+POLL_INTERVAL = 30
+# Market search results are shared by an asset's slots for at most this long, and
+# never past the start of the next slot
+MARKET_TTL = SLOT - BUFFER
 
+# Shared by every order/record/key; interned so dict/set probes hit on identity
+_BUY = sys.intern("BUY")
+_SELL = sys.intern("SELL")
+_YES = sys.intern("YES")
+_NO = sys.intern("NO")
+_FILLED = sys.intern("FILLED")
+_STRATEGY = sys.intern("sniper")
+
+
+class OrderInfo:
+    """Standing sniper order. Instances are pooled and reused across orders."""
+    __slots__ = ("order_id", "token_id", "condition_id", "market_name",
+                 "asset", "side", "price", "shares", "filled", "placed_at", "presigned_sell")
 
-class Sniper(BaseStrategy):
     def __init__(self):
-        super().__init__("Sniper")
-        self._executor = SmartExecutor()
-        self._notifier = get_notifier()
+        self.clear()
+
+    def clear(self):
+        self.order_id = self.token_id = self.condition_id = ""
+        self.market_name = self.asset = self.side = ""
+        self.price = 0.0
+        self.shares = 0
+        self.filled = 0.0  # shares matched so far (orders can fill in parts)
+        self.placed_at = 0.0
+        self.presigned_sell = None
+
+
+class Sniper(BaseStrategy):
+    def __init__(self, **services):
+        super().__init__("Sniper", **services)
         self._seen: set = set()
-        self._standing: dict = {}
+        self._standing: dict[str, OrderInfo] = {}
+        # Free-list: 2 sides x 2 slots per asset, with headroom for overlap
+        self._order_pool = [OrderInfo() for _ in range(4 * len(cfg.SNIPER_ASSETS) * 2)]
+        self._cost_per_cycle = cfg.SNIPER_PRICE * cfg.SNIPER_SHARES * 2 * len(cfg.SNIPER_ASSETS)
+        self._expected_profit_per_share = cfg.SNIPER_SELL_TARGET - cfg.SNIPER_PRICE
+        # asset -> (expires_at epoch s, search task); the search text doesn't depend on the slot
+        self._market_cache: dict[str, tuple[float, asyncio.Future]] = {}
+        self._order_stream = None
+        # Producers (user stream / fallback poller) push (trade_id, order, shares, done)
+        # fills; one consumer handles them and releases the order once done
+        self._fill_queue: asyncio.Queue[tuple[str, OrderInfo, float, bool]] = asyncio.Queue()
+        self._fill_consumer_task: Optional[asyncio.Task] = None
+        self._reconcile_tasks: set[asyncio.Task] = set()  # held so they aren't GC'd mid-run
+        self._fill_count = 0
 
     async def on_start(self):
         await self._executor.start()
-        cost = cfg.SNIPER_PRICE * cfg.SNIPER_SHARES * 2 * len(cfg.SNIPER_ASSETS)
-        self.emit_alert("success", f"[{self._executor.mode}] Sniper: {', '.join(cfg.SNIPER_ASSETS)} @${cfg.SNIPER_PRICE} cost=${cost:.2f}/cycle")
+        if self._fill_consumer_task is None:
+            self._fill_consumer_task = asyncio.create_task(self._fill_consumer())
+        self.emit_alert("success", f"[{self._executor.mode}] Sniper: {', '.join(cfg.SNIPER_ASSETS)} @${cfg.SNIPER_PRICE} cost=${self._cost_per_cycle:.2f}/cycle")
+        # Live orders rest on the CLOB: take fills from the user stream instead of polling
+        if cfg.trading_mode() == "LIVE" and self._order_stream is None:
+            self._order_stream = UserOrderWatcher(self._on_order_event, on_connect=self._on_stream_connect)
+            await self._order_stream.start()
 
     async def on_stop(self):
-        await self._executor.stop()
-        for oid in list(self._standing.keys()):
-            await self._client.cancel_order(oid)
+        if self._order_stream:
+            await self._order_stream.stop()
+            self._order_stream = None
+        if self._fill_consumer_task:
+            # Let already-detected fills get their auto-sell before shutting down
+            try:
+                await asyncio.wait_for(self._fill_queue.join(), timeout=10)
+            except asyncio.TimeoutError:
+                logger.warning(f"Sniper stopping with {self._fill_queue.qsize()} unhandled fills")
+            self._fill_consumer_task.cancel()
+            self._fill_consumer_task = None
+        if self._standing:
+            await self._client.cancel_orders(list(self._standing))
+            for info in self._standing.values():
+                self._release_order(info)
+            self._standing.clear()
 
     async def run_once(self):
-        await self._place_orders()
-        await self._check_fills()
-        await asyncio.sleep(30)
+        complete = await self._place_orders()
+        polling = not (self._order_stream and self._order_stream.is_connected)
+        if polling:
+            await self._check_fills()
+        # Sleep until the next slot event unless there is still work to poll for
+        must_poll = not complete or (polling and bool(self._standing))
+        await asyncio.sleep(self._next_wake(POLL_INTERVAL if must_poll else None))
 
-    async def _place_orders(self):
+    @staticmethod
+    def _next_wake(cap: Optional[float] = None) -> float:
+        """Seconds until the current slot's entry buffer ends or the next slot opens."""
+        now = time.time()
+        cur = now - now % SLOT
+        wake_in = min(c - now for c in (cur + BUFFER + 1, cur + SLOT + 1) if c > now)
+        if cap is not None:
+            wake_in = min(wake_in, cap)
+        return max(1.0, wake_in)
+
+    async def _place_orders(self) -> bool:
+        """Snipe every due (asset, slot). Returns False if any is still unresolved."""
         now = int(time.time())
-        cur = math.floor(now / SLOT) * SLOT
-        into = now - cur
+        into = now % SLOT
+        cur = now - into
+        nxt = cur + SLOT
+        tasks = []
+        keys = []
         for asset in cfg.SNIPER_ASSETS:
-            if into > BUFFER:
-                key = f"{asset}-{cur}"
-                if key not in self._seen:
-                    await self._snipe(asset, cur, key)
-            nxt = cur + SLOT
-            nkey = f"{asset}-{nxt}"
-            if nkey not in self._seen:
-                await self._snipe(asset, nxt, nkey)
-
-    async def _snipe(self, asset: str, slot: int, key: str):
-        markets = await self._client.search_markets(f"{asset} updown 5m", limit=10)
+            slots = [cur, nxt] if into > BUFFER else [nxt]
+            for key in (sys.intern(f"{asset}-{slot}") for slot in slots):
+                if key in self._seen:
+                    continue
+                # Claim the key before scheduling so concurrent passes can't double-snipe
+                self._seen.add(key)
+                keys.append(key)
+                tasks.append(self._snipe(asset, key))
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for key, r in zip(keys, results):
+                if isinstance(r, Exception):
+                    logger.error(f"Sniper {key} failed: {r}")
+                    self.emit_alert("error", "{} failed: {}", key, r)
+        # _snipe releases its key when the market could not be resolved
+        return all(k in self._seen for k in keys)
+
+    async def _search_markets(self, asset: str) -> list[dict]:
+        """
+        Search results for `asset`, shared by concurrent and repeat lookups until
+        MARKET_TTL passes or the next slot starts. Failed searches are not kept.
+        """
+        now = time.time()
+        hit = self._market_cache.get(asset)
+        if hit is None or hit[0] <= now:
+            task = asyncio.ensure_future(self._client.search_markets(f"{asset} updown 5m", limit=10))
+            expires = min(now + MARKET_TTL, now - now % SLOT + SLOT)
+            hit = self._market_cache[asset] = (expires, task)
+        markets = None
+        try:
+            markets = await asyncio.shield(hit[1])
+        finally:
+            if markets is None and self._market_cache.get(asset) is hit:
+                del self._market_cache[asset]
+        return markets
+
+    async def _find_market(self, asset: str) -> Optional[tuple[str, str, str, str]]:
+        """Resolve (condition_id, yes_token, no_token, question) for the asset's 5m market."""
+        found = self._pick_market(asset, await self._search_markets(asset))
+        if found is None:
+            # Retries must search again rather than reread a list that didn't resolve
+            self._market_cache.pop(asset, None)
+        return found
+
+    @staticmethod
+    def _pick_market(asset: str, markets: list[dict]) -> Optional[tuple[str, str, str, str]]:
         mkt = next((m for m in markets if asset.lower() in m.get("question","").lower()), None)
         if not mkt:
-            return
+            return None
         cid = mkt.get("condition_id") or mkt.get("conditionId", "")
         tokens = mkt.get("tokens") or mkt.get("outcomes", [])
         if not cid or len(tokens) < 2:
-            return
-        yes_tok = no_tok = None
-        for t in tokens:
-            out = (t.get("outcome") or t.get("name","")).upper()
-            tid = t.get("token_id") or t.get("id","")
-            if "YES" in out or "UP" in out: yes_tok = tid
-            elif "NO" in out or "DOWN" in out: no_tok = tid
+            return None
+        yes_tok, no_tok = split_outcome_tokens(tokens)
         if not yes_tok or not no_tok:
+            return None
+        return cid, yes_tok, no_tok, mkt.get("question", f"{asset}")
+
+    async def _snipe(self, asset: str, key: str):
+        try:
+            found = await self._find_market(asset)
+        except Exception:
+            self._seen.discard(key)
+            raise
+        if not found:
+            self._seen.discard(key)
             return
-        self._seen.add(key)
-        q = mkt.get("question", f"{asset}")
-        self.emit_alert("info", f"[{self._executor.mode}] Sniping: {q[:30]} @${cfg.SNIPER_PRICE}")
-        for tok, side in [(yes_tok,"YES"),(no_tok,"NO")]:
-            r = await self._executor.place_limit(tok, "BUY", cfg.SNIPER_PRICE, cfg.SNIPER_SHARES, "sniper", cid, q, side)
+        cid, yes_tok, no_tok, q = found
+        price, shares, target = cfg.SNIPER_PRICE, cfg.SNIPER_SHARES, cfg.SNIPER_SELL_TARGET
+        self.emit_alert("info", "[{}] Sniping: {:.30} @${}", self._executor.mode, q, price)
+        sides = [(yes_tok, _YES), (no_tok, _NO)]
+        results = await asyncio.gather(
+            *(self._executor.place_limit(tok, _BUY, price, shares, _STRATEGY, cid, q, side)
+              for tok, side in sides),
+            return_exceptions=True,
+        )
+        live = cfg.trading_mode() == "LIVE"
+        for (tok, side), r in zip(sides, results):
+            if isinstance(r, Exception):
+                logger.warning(f"Sniper order {side} failed: {r}")
+                continue
             if r:
                 oid = r.get("order_id", f"sniper_{uuid.uuid4().hex[:8]}")
-                self._standing[oid] = {"oid": oid, "tok": tok, "cid": cid, "q": q,
-                                        "side": side, "price": cfg.SNIPER_PRICE, "shares": cfg.SNIPER_SHARES}
+                info = self._acquire_order()
+                info.order_id = oid
+                info.token_id = tok
+                info.condition_id = cid
+                info.market_name = q
+                info.asset = asset
+                info.side = side
+                info.price = price
+                info.shares = shares
+                info.placed_at = time.monotonic()
+                self._standing[oid] = info
+                if live:
+                    # Sign the auto-sell now so a fill only costs one POST
+                    info.presigned_sell = await self._client.sign_limit_order(
+                        tok, _SELL, target, shares,
+                    )
+
+    def _acquire_order(self) -> OrderInfo:
+        return self._order_pool.pop() if self._order_pool else OrderInfo()
+
+    def _release_order(self, info: OrderInfo):
+        info.clear()
+        self._order_pool.append(info)
+
+    def _on_order_event(self, evt: dict):
+        """User-stream callback: dispatch fills/cancels of our standing orders."""
+        etype = evt.get("event_type", "")
+        if etype == "order":
+            if evt.get("type") == "CANCELLATION":
+                oid = evt.get("id")
+                info = self._standing.pop(oid, None)
+                if info:
+                    # Via the queue, so earlier partial fills are handled before release
+                    self._fill_queue.put_nowait((oid, info, 0.0, True))
+            return
+        # Trades report MATCHED first, then MINED/CONFIRMED; act on the first only
+        if etype != "trade" or evt.get("status", "MATCHED") != "MATCHED":
+            return
+        trade_id = evt.get("id")
+        matches = [(evt.get("taker_order_id"), evt.get("size"))]
+        matches.extend((m.get("order_id"), m.get("matched_amount")) for m in evt.get("maker_orders") or [])
+        for oid, matched in matches:
+            info = self._standing.get(oid) if oid else None
+            if info:
+                self._queue_fill(trade_id or oid, info, matched)
+
+    def _queue_fill(self, trade_id: str, info: OrderInfo, matched=None):
+        """Queue a fill of `matched` shares (the rest of the order if unknown)."""
+        remaining = info.shares - info.filled
+        try:
+            size = min(float(matched), remaining) if matched is not None else remaining
+        except (TypeError, ValueError):
+            size = remaining
+        info.filled += size
+        done = info.filled >= info.shares - 1e-9
+        if done:
+            # Fully matched: no longer standing
+            self._standing.pop(info.order_id, None)
+        self._fill_queue.put_nowait((trade_id, info, size, done))
+
+    def _on_stream_connect(self):
+        """Fills matched while the stream was down are never sent: reconcile by polling once."""
+        if self._standing:
+            task = asyncio.create_task(self._check_fills())
+            self._reconcile_tasks.add(task)
+            task.add_done_callback(self._reconcile_tasks.discard)
 
     async def _check_fills(self):
+        """Polling fallback for paper/dry-run mode or while the user stream is down."""
         if not self._standing:
             return
         try:
             open_ids = {(o.get("id") or o.get("order_id")) for o in await self._client.get_open_orders()}
-            for oid, info in list(self._standing.items()):
-                if oid not in open_ids:
-                    await self._handle_fill(oid, info)
-                    del self._standing[oid]
+            for oid in self._standing.keys() - open_ids:
+                info = self._standing.get(oid)
+                if info:
+                    self._queue_fill(oid, info)
         except Exception as e:
             logger.warning(f"Fill check: {e}")
 
-    async def _handle_fill(self, oid: str, info: dict):
-        self.emit_alert("success", f"SNIPER FILL! {info['q'][:25]} {info['side']} @${info['price']:.2f} x{info['shares']}")
-        self._notifier.sniper_fill(info["q"], info["price"], info["shares"], paper=cfg.PAPER_TRADE)
-        await self._executor.place_limit(
-            info["tok"], "SELL", cfg.SNIPER_SELL_TARGET, info["shares"], "sniper",
-            info["cid"], info["q"], info["side"],
+    async def _fill_consumer(self):
+        while True:
+            trade_id, info, size, done = await self._fill_queue.get()
+            try:
+                if size > 0:
+                    await self._handle_fill(trade_id, info, size)
+            except Exception as e:
+                logger.error(f"Sniper fill {trade_id}: {e}")
+                self.emit_alert("error", "Fill handling failed for {}: {}", trade_id, e)
+            finally:
+                if done:
+                    self._release_order(info)
+                self._fill_queue.task_done()
+
+    async def _handle_fill(self, trade_id: str, info: OrderInfo, size: float):
+        target = cfg.SNIPER_SELL_TARGET
+        # Rest the auto-sell first; alerts and bookkeeping can follow. The presigned
+        # sell covers the whole order, so it only fits a fill of all shares at once.
+        if info.presigned_sell is not None and size == info.shares:
+            sell = await self._client.post_signed_order(info.presigned_sell)
+        else:
+            sell = await self._executor.place_limit(
+                info.token_id, _SELL, target, size, _STRATEGY,
+                info.condition_id, info.market_name, info.side,
+            )
+        info.presigned_sell = None
+        self.emit_alert(
+            "success", "SNIPER FILL! {q:.25} {side} @${price:.2f} x{shares:g} (exp +${profit:.2f})",
+            q=info.market_name, side=info.side, price=info.price, shares=size,
+            profit=self._expected_profit_per_share * size,
         )
+        self._notifier.sniper_fill(info.market_name, info.price, size, paper=cfg.PAPER_TRADE)
         self._portfolio.record_trade(TradeRecord(
-            trade_id=oid, strategy="sniper", market_name=info["q"],
-            condition_id=info["cid"], token_id=info["tok"], side="BUY",
-            price=info["price"], size=info["shares"], total=info["price"]*info["shares"], status="FILLED",
+            trade_id=trade_id, strategy=_STRATEGY, market_name=info.market_name,
+            condition_id=info.condition_id, token_id=info.token_id, side=_BUY,
+            price=info.price, size=size, total=info.price*size, status=_FILLED,
         ))
+        self._fill_count += 1
+        # Only real fills become positions: paper ones live in the paper wallet,
+        # and dry-run "fills" are placeholder orders that never traded
+        if cfg.trading_mode() == "LIVE":
+            sell_order_id = (sell or {}).get("orderID") or (sell or {}).get("order_id")
+            position_id = f"{info.condition_id}-{info.token_id}"
+            existing = self._portfolio.get_position(position_id)
+            if existing:
+                # Later part of a partially filled order: grow the position
+                self._portfolio.update_position(
+                    position_id, shares=existing.shares + size,
+                    total_cost=existing.total_cost + info.price * size,
+                    sell_order_id=sell_order_id,
+                )
+            else:
+                self._portfolio.add_position(MarketPosition(
+                    condition_id=info.condition_id, token_id=info.token_id,
+                    market_name=info.market_name, outcome=info.side, shares=size,
+                    avg_buy_price=info.price, total_cost=info.price * size, strategy=_STRATEGY,
+                ))
+                self._portfolio.update_position(position_id, status="selling", sell_order_id=sell_order_id)
 
     def get_status(self):
-        cost = cfg.SNIPER_PRICE * cfg.SNIPER_SHARES * 2 * len(cfg.SNIPER_ASSETS)
-        return {**super().get_status(), "standing": len(self._standing), "mode": self._executor.mode, "cost_per_cycle": cost}
+        return {**super().get_status(), "standing": len(self._standing), "filled": self._fill_count, "mode": self._executor.mode, "cost_per_cycle": self._cost_per_cycle}
@@ -3,7 +3,10 @@ Main Textual TUI Application - Ultimate Trader
 """
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime
+from itertools import islice
+from typing import Optional
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -26,6 +29,11 @@ from ui.screens.trial import TrialScreen
 
 logger = logging.getLogger(__name__)
 
+# Periodic refresh backs off to REFRESH_IDLE after IDLE_TICKS refreshes with no changes
+REFRESH_FAST = 5
+REFRESH_IDLE = 15
+IDLE_TICKS = 3
+
 CSS = """
 Screen { background: $surface; }
 .dry-run-banner  { background: $warning;  color: $text; text-align: center; height: 1; text-style: bold; }
@@ -56,7 +64,16 @@ class UltimateTraderApp(App):
         self._notifier  = get_notifier()
         self._executor  = SmartExecutor()
         self._strategies: dict = {}
-        self._alerts: list = []
+        self._alerts: deque = deque(maxlen=100)  # newest first
+        self._pending_broadcast: list = []
+        self._broadcast_scheduled = False
+        self._dashboard: Optional[DashboardScreen] = None
+        # tab id -> screen with a refresh_data() hook; only the active tab is refreshed
+        # (each screen catches up in its own on_show when its tab is switched to)
+        self._refreshable_screens: dict = {}
+        self._refresh_timer = None
+        self._refresh_interval = REFRESH_FAST
+        self._no_change_count = 0
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -82,23 +99,33 @@ class UltimateTraderApp(App):
         yield Footer()
 
     async def on_mount(self):
+        self._dashboard = self.query_one(DashboardScreen)
+        self._refreshable_screens = {
+            "dashboard": self._dashboard,
+            "markets": self.query_one(MarketsScreen),
+            "positions": self.query_one(PositionsScreen),
+        }
+        # One executor/notifier/client shared by every strategy
+        shared = dict(executor=self._executor, notifier=self._notifier, client=self._client)
         self._strategies = {
-            "auto":   AutoTrader(),
-            "copy":   CopyTrader(),
-            "mm":     MarketMaker(),
-            "sniper": Sniper(),
+            "auto":   AutoTrader(**shared),
+            "copy":   CopyTrader(**shared),
+            "mm":     MarketMaker(**shared),
+            "sniper": Sniper(**shared),
         }
         for s in self._strategies.values():
             s.add_alert_handler(self._handle_alert)
 
-        # Start support services
-        await self._notifier.start()
-        await self._executor.start()
-
-        try:
-            await self._client.initialize()
-        except Exception as e:
-            self._handle_alert("error", f"[Client] Init failed: {e}")
+        # Start support services concurrently so their connection setup overlaps
+        results = await asyncio.gather(
+            self._notifier.start(),
+            self._executor.start(),
+            self._client.initialize(),
+            return_exceptions=True,
+        )
+        for svc, r in zip(("Notifier", "Executor", "Client"), results):
+            if isinstance(r, Exception):
+                self._handle_alert("error", f"[{svc}] Init failed: {r}")
 
         mode = cfg.trading_mode()
         self._notifier.system_alert(f"Ultimate Trader started — Mode: {mode}")
@@ -109,22 +136,38 @@ class UltimateTraderApp(App):
             await auto.start()
             self._handle_alert("success", "AutoTrader auto-started — scanning crypto markets")
 
-        self.set_interval(5, self.action_refresh)
+        self._refresh_timer = self.set_interval(REFRESH_FAST, self.action_refresh)
 
     def _handle_alert(self, level: str, message: str):
         ts = datetime.now().strftime("%H:%M:%S")
-        self._alerts.insert(0, (ts, level, message))
-        self._alerts = self._alerts[:100]
-        self.call_from_thread(self._broadcast_alert, ts, level, message)
+        alert = (ts, level, message)
+        self._alerts.appendleft(alert)
+        self._pending_broadcast.append(alert)
+        # Coalesce bursts: one hop into the UI loop drains everything queued so far
+        if not self._broadcast_scheduled:
+            self._broadcast_scheduled = True
+            try:
+                self.call_from_thread(self._flush_broadcasts)
+            except RuntimeError:
+                # Already on the app thread (strategies share the app's event loop)
+                self.call_later(self._flush_broadcasts)
+
+    def _flush_broadcasts(self):
+        pending, self._pending_broadcast = self._pending_broadcast, []
+        self._broadcast_scheduled = False
+        for ts, level, message in pending:
+            self._broadcast_alert(ts, level, message)
 
     def _broadcast_alert(self, ts, level, message):
+        if self._dashboard is None:
+            return
         try:
-            self.query_one(DashboardScreen).add_alert(ts, level, message)
+            self._dashboard.add_alert(ts, level, message)
         except Exception:
             pass
 
     def _get_alert_feed(self):
-        return self._alerts[:30]
+        return list(islice(self._alerts, 30))
 
     async def _toggle_strategy(self, name: str, enable: bool):
         s = self._strategies.get(name)
@@ -143,15 +186,45 @@ class UltimateTraderApp(App):
 
     async def action_refresh(self):
         try:
-            await self.query_one(DashboardScreen).refresh_data()
+            active = self.query_one(TabbedContent).active
         except Exception:
-            pass
+            return
+        screen = self._refreshable_screens.get(active)
+        screens = [screen] if screen is not None else []
+        results = await asyncio.gather(
+            *(s.refresh_data() for s in screens),
+            return_exceptions=True,
+        )
+        changed = False
+        for screen, r in zip(screens, results):
+            if isinstance(r, Exception):
+                self._handle_alert("error", f"[{type(screen).__name__}] Refresh failed: {r}")
+            elif r:
+                changed = True
+        if changed:
+            self._no_change_count = 0
+            self._set_refresh_interval(REFRESH_FAST)
+        else:
+            self._no_change_count += 1
+            if self._no_change_count >= IDLE_TICKS:
+                self._set_refresh_interval(REFRESH_IDLE)
+
+    def _set_refresh_interval(self, seconds: float):
+        if seconds == self._refresh_interval or self._refresh_timer is None:
+            return
+        self._refresh_timer.stop()
+        self._refresh_interval = seconds
+        self._refresh_timer = self.set_interval(seconds, self.action_refresh)
 
     async def action_quit(self):
         for s in self._strategies.values():
             if s.is_running:
                 await s.stop()
-        await self._executor.stop()
-        await self._notifier.stop()
-        await self._client.close()
+        self._portfolio.flush()
+        await asyncio.gather(
+            self._executor.stop(),
+            self._notifier.stop(),
+            self._client.close(),
+            return_exceptions=True,
+        )
         self.exit()
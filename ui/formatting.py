@@ -0,0 +1,223 @@
+"""
+Shared Table Formatting
+Cell formatters, a row cache and keyed in-place DataTable updates.
+"""
+import asyncio
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Hashable, Optional
+
+try:
+    from orjson import loads as json_loads  # optional, ~2-3x faster decoding
+except ImportError:
+    from json import loads as json_loads
+
+
+# Screen watchers coalesce bursts of change events into one refresh per interval
+WATCH_DEBOUNCE = 1.0
+
+MILLION = 1_000_000.0
+THOUSAND = 1_000.0
+
+# Indexed by `value >= 0`: P&L style and explicit sign for non-negatives
+PNL_COLOR = ("red", "green")
+PNL_SIGN = ("", "+")
+
+YES_OUTCOMES = frozenset(("YES", "UP"))
+# market id -> position of the YES/UP outcome; cleared wholesale when full
+_YES_INDEX_CACHE: dict[str, int] = {}
+_YES_INDEX_MAX = 4096
+
+
+def fmt_usd(v: float, zero: str = "$0") -> str:
+    """Compact dollar amount: $1.2M / $350K / $42."""
+    if v >= MILLION:
+        return f"${v/MILLION:.1f}M"
+    if v >= THOUSAND:
+        return f"${v/THOUSAND:.0f}K"
+    if v > 0:
+        return f"${v:.0f}"
+    return zero
+
+
+@lru_cache(maxsize=2048)
+def truncate(s: str, n: int) -> str:
+    """`s` cut to at most `n` chars, ending in an ellipsis if cut; short strings pass through."""
+    return s if len(s) <= n else s[:n - 1] + "…"
+
+
+@lru_cache(maxsize=1024)
+def _decode_list(raw: str) -> tuple:
+    """outcomes/outcomePrices strings repeat across polls; decode each distinct one once."""
+    return tuple(json_loads(raw))
+
+
+def yes_index(m: dict) -> int:
+    """Index of the YES/UP outcome in the market's outcome lists (0 if unknown)."""
+    mid = market_id(m)
+    idx = _YES_INDEX_CACHE.get(mid) if mid else None
+    if idx is not None:
+        return idx
+    idx = 0
+    # outcomes is a JSON string: '["Yes", "No"]' (or '["Up", "Down"]')
+    raw = m.get("outcomes") or m.get("tokens") or ()
+    try:
+        outcomes = _decode_list(raw) if isinstance(raw, str) else raw
+        for i, o in enumerate(outcomes):
+            name = o.get("outcome", "") if isinstance(o, dict) else str(o)
+            if name.upper() in YES_OUTCOMES:
+                idx = i
+                break
+    except Exception:
+        pass
+    if mid:
+        if len(_YES_INDEX_CACHE) >= _YES_INDEX_MAX:
+            _YES_INDEX_CACHE.clear()
+        _YES_INDEX_CACHE[mid] = idx
+    return idx
+
+
+def yes_probability(m: dict) -> Optional[float]:
+    """YES price in [0, 1] from outcomePrices, else lastTradePrice; None if unknown."""
+    # outcomePrices is a JSON string: '["0.615", "0.385"]'
+    raw_prices = m.get("outcomePrices") or "[]"
+    try:
+        prices = _decode_list(raw_prices) if isinstance(raw_prices, str) else raw_prices
+        if prices:
+            return float(prices[yes_index(m)])
+    except Exception:
+        pass
+    else:
+        return None
+    ltp = m.get("lastTradePrice")
+    try:
+        return float(ltp) if ltp else None
+    except (TypeError, ValueError):
+        return None
+
+
+def market_id(m: dict) -> Optional[str]:
+    return m.get("id") or m.get("condition_id") or m.get("conditionId")
+
+
+def market_key(m: dict) -> tuple:
+    """The raw fields a market row is formatted from; a change means re-format."""
+    return (
+        m.get("volumeNum") or m.get("volume"),
+        m.get("outcomePrices"),
+        m.get("liquidityNum") or m.get("liquidity"),
+        m.get("lastTradePrice"),
+    )
+
+
+class RowCache:
+    """
+    Bounded LRU of formatted table rows. Entries are keyed by row id and
+    revalidated against a data key, so unchanged rows skip formatting.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self._rows: OrderedDict[Hashable, tuple[tuple, tuple]] = OrderedDict()
+        self._maxsize = maxsize
+
+    def get(self, row_id: Optional[Hashable], key: tuple, build: Callable[..., tuple], *args) -> tuple:
+        """Cached row for `row_id` if its key still matches, else `build(*args)`."""
+        row = self.lookup(row_id, key)
+        if row is None:
+            row = build(*args)
+            self.put(row_id, key, row)
+        return row
+
+    def lookup(self, row_id: Optional[Hashable], key: tuple) -> Optional[tuple]:
+        """Cached row for `row_id` if its key still matches, else None."""
+        hit = self._rows.get(row_id) if row_id is not None else None
+        if hit is not None and hit[0] == key:
+            self._rows.move_to_end(row_id)
+            return hit[1]
+        return None
+
+    def put(self, row_id: Optional[Hashable], key: tuple, row: tuple):
+        if row_id is None:
+            return
+        self._rows[row_id] = (key, row)
+        self._rows.move_to_end(row_id)
+        if len(self._rows) > self._maxsize:
+            self._rows.popitem(last=False)
+
+
+def cached_cells(obj, slot: str, key: tuple, build: Callable[..., tuple]) -> tuple:
+    """
+    Formatted cells memoized on the domain object itself (outside its dataclass
+    fields, so never persisted); rebuilt only when `key` changes. `slot` keeps
+    differently formatted tables of the same object apart. Records that never
+    change once written (trades) pass an empty key.
+    """
+    memo = obj.__dict__.setdefault("_fmt", {})
+    hit = memo.get(slot)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    cells = build(obj)
+    memo[slot] = (key, cells)
+    return cells
+
+
+def keyed_rows(items, key_of: Callable, row_of: Callable) -> dict:
+    """{row_key: cells} for `items`, suffixing repeated keys so none are lost."""
+    rows = {}
+    for i, item in enumerate(items):
+        key = key_of(item)
+        if key in rows:
+            key = f"{key}#{i}"
+        rows[key] = row_of(item)
+    return rows
+
+
+def same_rows(old: dict, new: dict) -> bool:
+    """True if both hold the same rows in the same order (dict == ignores order)."""
+    return len(old) == len(new) and list(old.items()) == list(new.items())
+
+
+def sync_rows(table, columns: list, old: dict, new: dict):
+    """
+    Bring a DataTable from `old` to `new` rows ({row_key: cells}), writing
+    only changed cells. Dropped rows are removed and new ones appended; if the
+    surviving rows changed order, the table is rebuilt instead. All edits are
+    made inside one batch_update so the table repaints once.
+    """
+    if same_rows(old, new):
+        return
+    with table.app.batch_update():
+        _apply_rows(table, columns, old, new)
+
+
+def _apply_rows(table, columns: list, old: dict, new: dict):
+    kept = [k for k in old if k in new]
+    if list(new)[:len(kept)] != kept:
+        table.clear()
+        for key, row in new.items():
+            table.add_row(*row, key=key)
+        return
+    for key in old.keys() - new.keys():
+        table.remove_row(key)
+    for key, row in new.items():
+        prev = old.get(key)
+        if prev is None:
+            table.add_row(*row, key=key)
+        elif prev != row:
+            for col, a, b in zip(columns, prev, row):
+                if a != b:
+                    table.update_cell(key, col, b)
+
+
+async def watch_changes(changed: asyncio.Event, shown: asyncio.Event, refresh: Callable[[], None]):
+    """
+    Call `refresh` whenever `changed` is set, at most once per WATCH_DEBOUNCE.
+    While `shown` is clear the event is left set, so a hidden screen refreshes
+    once it is shown again rather than on every change.
+    """
+    while True:
+        await changed.wait()
+        await shown.wait()
+        changed.clear()
+        refresh()
+        await asyncio.sleep(WATCH_DEBOUNCE)
@@ -5,9 +5,10 @@ from typing import Callable
 
 from textual.app import ComposeResult
 from textual.widget import Widget
-from textual.widgets import Button, DataTable, Label, Static, Switch
+from textual.widgets import Button, Label, Static
 
 import config as cfg
+from ui.formatting import truncate
 
 
 class BotControlScreen(Widget):
@@ -50,6 +51,14 @@ class BotControlScreen(Widget):
     }
     """
 
+    # button id -> (strategy name, enable)
+    _BTN_MAP = {
+        "start-auto": ("auto", True),     "stop-auto": ("auto", False),
+        "start-copy": ("copy", True),     "stop-copy": ("copy", False),
+        "start-mm": ("mm", True),         "stop-mm": ("mm", False),
+        "start-sniper": ("sniper", True), "stop-sniper": ("sniper", False),
+    }
+
     def __init__(self, strategies: dict, toggle_callback: Callable):
         super().__init__()
         self._strategies = strategies
@@ -57,6 +66,8 @@ class BotControlScreen(Widget):
 
     def compose(self) -> ComposeResult:
         mode = cfg.trading_mode()
+        copy_addr = cfg.COPY_TRADER_ADDRESS
+        sniper_assets, sniper_price = cfg.SNIPER_ASSETS, cfg.SNIPER_PRICE
         if mode == "PAPER":
             yield Static("PAPER TRADE MODE — Virtual money only, real market prices", classes="warning-text")
         elif mode == "DRY_RUN":
@@ -85,7 +96,7 @@ class BotControlScreen(Widget):
         with Widget(classes="strategy-card"):
             with Widget(classes="strategy-info"):
                 yield Label("[bold]Copy Trader[/bold]")
-                target = cfg.COPY_TRADER_ADDRESS[:16] + "..." if cfg.COPY_TRADER_ADDRESS else "Not configured"
+                target = truncate(copy_addr, 17) if copy_addr else "Not configured"
                 yield Label(f"Target: {target} | Size: {cfg.COPY_SIZE_PERCENT}% | Profit: {cfg.COPY_AUTO_SELL_PROFIT}%")
             with Widget(classes="strategy-controls"):
                 yield Button("Start", id="start-copy", variant="success")
@@ -104,8 +115,8 @@ class BotControlScreen(Widget):
         with Widget(classes="strategy-card"):
             with Widget(classes="strategy-info"):
                 yield Label("[bold]Orderbook Sniper[/bold]")
-                total_cost = cfg.SNIPER_PRICE * cfg.SNIPER_SHARES * 2 * len(cfg.SNIPER_ASSETS)
-                yield Label(f"Assets: {', '.join(cfg.SNIPER_ASSETS)} | Price: ${cfg.SNIPER_PRICE} | Cost: ${total_cost:.2f}/cycle")
+                total_cost = sniper_price * cfg.SNIPER_SHARES * 2 * len(sniper_assets)
+                yield Label(f"Assets: {', '.join(sniper_assets)} | Price: ${sniper_price} | Cost: ${total_cost:.2f}/cycle")
             with Widget(classes="strategy-controls"):
                 yield Button("Start", id="start-sniper", variant="success")
                 yield Button("Stop", id="stop-sniper", variant="error")
@@ -116,20 +127,6 @@ class BotControlScreen(Widget):
             yield Static(cfg.summary())
 
     async def on_button_pressed(self, event: Button.Pressed):
-        btn_id = event.button.id
-        if btn_id == "start-auto":
-            await self._toggle("auto", True)
-        elif btn_id == "stop-auto":
-            await self._toggle("auto", False)
-        elif btn_id == "start-copy":
-            await self._toggle("copy", True)
-        elif btn_id == "stop-copy":
-            await self._toggle("copy", False)
-        elif btn_id == "start-mm":
-            await self._toggle("mm", True)
-        elif btn_id == "stop-mm":
-            await self._toggle("mm", False)
-        elif btn_id == "start-sniper":
-            await self._toggle("sniper", True)
-        elif btn_id == "stop-sniper":
-            await self._toggle("sniper", False)
+        action = self._BTN_MAP.get(event.button.id)
+        if action:
+            await self._toggle(*action)
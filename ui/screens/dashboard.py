@@ -2,18 +2,19 @@
 Dashboard Screen - Main TUI screen with live market data, positions, and alerts.
 """
 import asyncio
-import json
+import time
+from collections import deque
 from datetime import datetime
-from typing import Callable
+from typing import Callable, Optional
 
 from textual.app import ComposeResult
-from textual.reactive import reactive
 from textual.widget import Widget
-from textual.widgets import DataTable, Label, RichLog, Static
+from textual.widgets import DataTable, RichLog, Static
 
 import config as cfg
 from core.polymarket.client import get_client
 from core.risk.portfolio import get_portfolio
+from ui.formatting import PNL_COLOR, RowCache, cached_cells, fmt_usd, market_id, market_key, same_rows, sync_rows, truncate, yes_probability
 
 LEVEL_COLORS = {
     "success": "green",
@@ -21,6 +22,51 @@ LEVEL_COLORS = {
     "warning": "yellow",
     "error": "red",
 }
+LEVEL_ICONS = {"success": "✓", "info": "ℹ", "warning": "⚠", "error": "✗"}
+# level -> opening markup, e.g. "[green]✓ "; closing tag kept alongside
+_LEVEL_PREFIX = {
+    lvl: (f"[{color}]{LEVEL_ICONS.get(lvl, '•')} ", f"[/{color}]")
+    for lvl, color in LEVEL_COLORS.items()
+}
+_DEFAULT_PREFIX = ("[white]• ", "[/white]")
+# Alerts held back while the log is off-screen (oldest dropped beyond this)
+ALERT_BACKLOG = 500
+# RichLog keeps at most this many lines, each at most ALERT_MAX_CHARS of message
+ALERT_LOG_LINES = 1000
+ALERT_MAX_CHARS = 500
+
+NO_POSITIONS = {"none": ("No open positions", "", "")}
+# Don't hit the markets endpoint more often than this, however often we're refreshed
+MARKET_MIN_INTERVAL = 3.0
+
+# Status bar: mode prefix is fixed per run, the P&L body only changes with stats
+STATUS_BODY = (
+    "[bold]Daily:[/bold] [{dc}]${daily:+.2f}[/{dc}]  "
+    "[bold]Total:[/bold] [{tc}]${total:+.2f}[/{tc}]  "
+    "[bold]Win:[/bold] {win_rate:.0f}%  "
+    "[bold]Open:[/bold] {open}  |  "
+)
+
+
+def _market_row(m: dict) -> tuple[str, str, str]:
+    """Formatted (market, prob, volume) cells for one market."""
+    question = m.get("question") or m.get("title", "")
+    p = yes_probability(m)
+    volume = float(m.get("volumeNum") or m.get("volume") or 0)
+
+    return (
+        truncate(question, 31),
+        f"{p*100:.0f}%" if p is not None else "?",
+        fmt_usd(volume, zero="-"),
+    )
+
+
+def _position_row(pos) -> tuple[str, str, str]:
+    return cached_cells(pos, "dashboard", (pos.pnl,), _format_position)
+
+
+def _format_position(pos) -> tuple[str, str, str]:
+    return (truncate(pos.market_name, 18), f"${pos.pnl:+.2f}", truncate(pos.strategy, 6))
 
 
 class DashboardScreen(Widget):
@@ -57,8 +103,34 @@ class DashboardScreen(Widget):
     def __init__(self, alert_feed_getter: Callable):
         super().__init__()
         self._alert_getter = alert_feed_getter
+        self._alert_backlog: deque = deque(maxlen=ALERT_BACKLOG)
+        # Widget handles, looked up once in on_mount (None until mounted)
+        self._market_table: Optional[DataTable] = None
+        self._pos_table: Optional[DataTable] = None
+        self._alert_log: Optional[RichLog] = None
+        self._status_bar: Optional[Static] = None
         self._client = get_client()
         self._portfolio = get_portfolio()
+        self._last_markets: list[dict] = []
+        # Rows currently shown in each table ({row_key: cells}), for in-place diffing
+        self._market_rows: dict[str, tuple] = {}
+        self._position_rows: dict[str, tuple] = {}
+        self._market_cols: list = []
+        self._position_cols: list = []
+        self._row_cache = RowCache()
+        self._markets_fetched_at = 0.0
+        # Fetching runs in a background task; it leaves formatted rows here for the UI
+        self._fetch_task: Optional[asyncio.Task] = None
+        self._pending_rows: Optional[dict[str, tuple]] = None
+        self._markets_changed = False
+        mode_str = (
+            "[yellow]DRY RUN[/yellow]" if cfg.DRY_RUN
+            else "[cyan]PAPER[/cyan]" if cfg.PAPER_TRADE
+            else "[red]LIVE[/red]"
+        )
+        self._mode_prefix = f" {mode_str}  |  "
+        self._last_stats_key: Optional[tuple] = None
+        self._status_body = ""
 
     def compose(self) -> ComposeResult:
         # Row 1 col 1: Markets table
@@ -72,7 +144,7 @@ class DashboardScreen(Widget):
         yield t2
 
         # Row 1 col 3: Alerts feed
-        al = RichLog(id="alert-log", classes="panel", highlight=True, markup=True)
+        al = RichLog(id="alert-log", classes="panel", max_lines=ALERT_LOG_LINES, highlight=True, markup=True)
         al.border_title = "LIVE ALERTS"
         yield al
 
@@ -81,76 +153,92 @@ class DashboardScreen(Widget):
 
     async def on_mount(self):
         """Initialize tables."""
-        market_table = self.query_one("#market-table", DataTable)
-        market_table.add_columns("Market", "Prob", "Volume")
+        self._market_table = self.query_one("#market-table", DataTable)
+        self._market_cols = self._market_table.add_columns("Market", "Prob", "Volume")
+
+        self._pos_table = self.query_one("#position-table", DataTable)
+        self._position_cols = self._pos_table.add_columns("Market", "P&L", "Strat")
 
-        pos_table = self.query_one("#position-table", DataTable)
-        pos_table.add_columns("Market", "P&L", "Strat")
+        self._alert_log = self.query_one("#alert-log", RichLog)
+        self._status_bar = self.query_one("#status-bar", Static)
 
         await self.refresh_data()
 
-    async def refresh_data(self):
-        """Fetch and update all dashboard data."""
+    def on_show(self):
+        # Hidden tabs skip the periodic refresh: catch up now. Alerts that arrived
+        # while another tab was active are rendered in one batch.
+        self.run_worker(self.refresh_data(), exclusive=True, group="refresh")
+        self.call_after_refresh(self._flush_alerts)
+
+    def on_unmount(self):
+        if self._fetch_task:
+            self._fetch_task.cancel()
+
+    async def refresh_data(self) -> bool:
+        """
+        Update all dashboard data. Returns True if anything changed. Never waits on
+        the network: market fetches run in a rate-limited background task.
+        """
+        self._kick_market_fetch()
+        changed, self._markets_changed = self._markets_changed, False
+        self._flush_alerts()
         try:
-            await self._update_markets()
-            self._update_positions()
+            changed = self._update_markets() or changed
+            changed = self._update_positions() or changed
             self._update_pnl()
             self._update_status_bar()
         except Exception as e:
             pass
+        return changed
+
+    def _kick_market_fetch(self):
+        """Start a background market fetch unless one is running or ran recently."""
+        now = time.monotonic()
+        if now - self._markets_fetched_at < MARKET_MIN_INTERVAL:
+            return
+        if self._fetch_task is not None and not self._fetch_task.done():
+            return
+        self._markets_fetched_at = now
+        self._fetch_task = asyncio.create_task(self._fetch_markets())
 
-    async def _update_markets(self):
-        """Refresh top markets table."""
+    async def _fetch_markets(self):
+        """Fetch + format top markets off the render path, then hand rows to the UI."""
         try:
-            markets = await self._client.get_markets(limit=20, order="volume")
-            table = self.query_one("#market-table", DataTable)
-            table.clear()
-
-            for m in markets[:15]:
-                question = m.get("question") or m.get("title", "")
-                # outcomePrices is a JSON string: '["0.615", "0.385"]'
-                raw_prices = m.get("outcomePrices") or "[]"
-                try:
-                    prices = json.loads(raw_prices) if isinstance(raw_prices, str) else raw_prices
-                    prob = f"{float(prices[0])*100:.0f}%" if prices else "?"
-                except Exception:
-                    prob = f"{float(m.get('lastTradePrice', 0))*100:.0f}%" if m.get('lastTradePrice') else "?"
-
-                volume = float(m.get("volumeNum") or m.get("volume") or 0)
-                if volume >= 1_000_000:
-                    vol_str = f"${volume/1_000_000:.1f}M"
-                elif volume >= 1_000:
-                    vol_str = f"${volume/1_000:.0f}K"
-                elif volume > 0:
-                    vol_str = f"${volume:.0f}"
-                else:
-                    vol_str = "-"
-
-                table.add_row(
-                    question[:30] + ("…" if len(question) > 30 else ""),
-                    prob,
-                    vol_str,
-                )
+            markets = (await self._client.get_markets(limit=20, order="volume"))[:15]
         except Exception:
-            pass
-
-    def _update_positions(self):
-        """Refresh active positions table."""
-        table = self.query_one("#position-table", DataTable)
-        table.clear()
-        positions = self._portfolio.get_open_positions()
-
-        if not positions:
-            table.add_row("No open positions", "", "")
             return
+        if markets == self._last_markets:
+            return
+        cache = self._row_cache
+        rows = {}
+        for i, m in enumerate(markets):
+            mid = market_id(m)
+            rows[mid or f"#{i}"] = cache.get(mid, market_key(m), _market_row, m)
+        self._pending_rows = rows
+        self._last_markets = markets
+        self._markets_changed = True
+        self.call_later(self._update_markets)
 
-        for pos in positions:
-            pnl_str = f"${pos.pnl:+.2f}"
-            table.add_row(
-                pos.market_name[:18],
-                pnl_str,
-                pos.strategy[:6],
-            )
+    def _update_markets(self) -> bool:
+        """Paint rows left by the last fetch, if any. Returns False if none were pending."""
+        if self._pending_rows is None or self._market_table is None:
+            return False
+        rows, self._pending_rows = self._pending_rows, None
+        sync_rows(self._market_table, self._market_cols, self._market_rows, rows)
+        self._market_rows = rows
+        return True
+
+    def _update_positions(self) -> bool:
+        """Refresh active positions table. Returns False if nothing changed."""
+        rows = {
+            pos.position_id: _position_row(pos)
+            for pos in self._portfolio.get_open_positions()
+        } or NO_POSITIONS
+        if same_rows(self._position_rows, rows) or self._pos_table is None:
+            return False
+        sync_rows(self._pos_table, self._position_cols, self._position_rows, rows)
+        self._position_rows = rows
+        return True
 
     def _update_pnl(self):
         pass  # merged into _update_status_bar
@@ -158,36 +246,40 @@ class DashboardScreen(Widget):
     def _update_status_bar(self):
         """Update bottom status bar with P&L + bot state."""
         stats = self._portfolio.get_stats()
-        daily = stats["daily_pnl"]
-        total = stats["total_pnl"]
-        win_rate = stats["win_rate"]
-        daily_color = "green" if daily >= 0 else "red"
-        total_color = "green" if total >= 0 else "red"
-        mode_str = (
-            "[yellow]DRY RUN[/yellow]" if cfg.DRY_RUN
-            else "[cyan]PAPER[/cyan]" if cfg.PAPER_TRADE
-            else "[red]LIVE[/red]"
-        )
-        text = (
-            f" {mode_str}  |  "
-            f"[bold]Daily:[/bold] [{daily_color}]${daily:+.2f}[/{daily_color}]  "
-            f"[bold]Total:[/bold] [{total_color}]${total:+.2f}[/{total_color}]  "
-            f"[bold]Win:[/bold] {win_rate:.0f}%  "
-            f"[bold]Open:[/bold] {stats['open_positions']}  |  "
-            f"[dim]{datetime.now().strftime('%H:%M:%S')}[/dim]"
-        )
-        try:
-            self.query_one("#status-bar", Static).update(text)
-        except Exception:
-            pass
+        daily = stats.daily_pnl
+        total = stats.total_pnl
+        key = (daily, total, stats.win_rate, stats.open_positions)
+        if key != self._last_stats_key:
+            self._last_stats_key = key
+            self._status_body = STATUS_BODY.format(
+                dc=PNL_COLOR[daily >= 0], daily=daily,
+                tc=PNL_COLOR[total >= 0], total=total,
+                win_rate=key[2], open=key[3],
+            )
+        text = f"{self._mode_prefix}{self._status_body}[dim]{datetime.now():%H:%M:%S}[/dim]"
+        if self._status_bar is not None:
+            self._status_bar.update(text)
 
     def add_alert(self, ts: str, level: str, message: str):
-        """Add new alert to the log."""
-        color = LEVEL_COLORS.get(level, "white")
-        icons = {"success": "✓", "info": "ℹ", "warning": "⚠", "error": "✗"}
-        icon = icons.get(level, "•")
+        """Add new alert to the log (buffered while the log is off-screen)."""
+        self._alert_backlog.append((ts, level, message))
+        self._flush_alerts()
+
+    def _flush_alerts(self):
+        """Render buffered alerts, but only once the log is actually on screen."""
+        log = self._alert_log
+        if not self._alert_backlog or log is None:
+            return
         try:
-            log = self.query_one("#alert-log", RichLog)
-            log.write(f"[dim]{ts}[/dim] [{color}]{icon} {message}[/{color}]")
+            if not log.region.overlaps(self.screen.region):
+                return
         except Exception:
-            pass
+            return
+        backlog = self._alert_backlog
+        while backlog:
+            ts, level, message = backlog.popleft()
+            opening, closing = _LEVEL_PREFIX.get(level, _DEFAULT_PREFIX)
+            # Not the cached truncate(): alerts are unique and would evict market names
+            if len(message) > ALERT_MAX_CHARS:
+                message = message[:ALERT_MAX_CHARS - 1] + "…"
+            log.write(f"[dim]{ts}[/dim] {opening}{message}{closing}")
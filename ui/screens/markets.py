@@ -1,13 +1,42 @@
 """
 Markets Screen - Browse and search Polymarket prediction markets.
 """
-import json
-
+import numpy as np
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import DataTable, Input, Label, Static
 
 from core.polymarket.client import get_client
+from ui.formatting import MILLION, THOUSAND, RowCache, market_id, market_key, sync_rows, truncate, yes_probability
+
+
+def _usd_column(values: np.ndarray) -> list[str]:
+    """Vectorized fmt_usd over a whole column: $1.2M / $350K / $42 / $0."""
+    big = values >= MILLION
+    mid = (values >= THOUSAND) & ~big
+    out = np.char.mod("$%.0f", values)
+    out = np.where(mid, np.char.mod("$%.0fK", values / THOUSAND), out)
+    out = np.where(big, np.char.mod("$%.1fM", values / MILLION), out)
+    return np.where(values > 0, out, "$0").tolist()
+
+
+def _market_rows(markets: list[dict]) -> list[tuple[str, str, str, str, str]]:
+    """Formatted (market, prob, volume, liquidity, end) cells, one tuple per market."""
+    n = len(markets)
+    vols = np.fromiter((float(m.get("volumeNum") or m.get("volume") or 0) for m in markets), np.float64, n)
+    liqs = np.fromiter((float(m.get("liquidityNum") or m.get("liquidity") or 0) for m in markets), np.float64, n)
+    rows = []
+    for m, vol_str, liq_str in zip(markets, _usd_column(vols), _usd_column(liqs)):
+        question = m.get("question") or m.get("title", "N/A")
+        p = yes_probability(m)
+        rows.append((
+            truncate(question, 46),
+            f"{p*100:.1f}%" if p is not None else "?",
+            vol_str,
+            liq_str,
+            (m.get("endDateIso") or m.get("end_date_iso", ""))[:10],
+        ))
+    return rows
 
 
 class MarketsScreen(Widget):
@@ -33,6 +62,10 @@ class MarketsScreen(Widget):
         super().__init__()
         self._client = get_client()
         self._all_markets: list[dict] = []
+        self._query = ""
+        self._row_cache = RowCache()
+        self._rows: dict[str, tuple] = {}
+        self._columns: list = []
 
     def compose(self) -> ComposeResult:
         yield Static("PREDICTION MARKET BROWSER", classes="panel-title")
@@ -41,50 +74,44 @@ class MarketsScreen(Widget):
 
     async def on_mount(self):
         table = self.query_one("#markets-table", DataTable)
-        table.add_columns("Market", "Prob YES", "Volume", "Liquidity", "End Date")
+        self._columns = table.add_columns("Market", "Prob YES", "Volume", "Liquidity", "End Date")
         await self._load_markets()
 
-    async def _load_markets(self, query: str = ""):
-        table = self.query_one("#markets-table", DataTable)
-        table.clear()
-
+    async def _load_markets(self, query: str = "") -> bool:
+        """Fetch and render the listing. Returns False if it is unchanged."""
         if query:
             markets = await self._client.search_markets(query, limit=50)
         else:
             markets = await self._client.get_markets(limit=50, order="volume")
 
+        table = self.query_one("#markets-table", DataTable)
+        if markets == self._all_markets and table.row_count:
+            return False
         self._all_markets = markets
 
-        for m in markets:
-            question = m.get("question") or m.get("title", "N/A")
-            # outcomePrices is a JSON string: '["0.615", "0.385"]'
-            raw_prices = m.get("outcomePrices") or "[]"
-            try:
-                prices = json.loads(raw_prices) if isinstance(raw_prices, str) else raw_prices
-                prob = f"{float(prices[0])*100:.1f}%" if prices else "?"
-            except Exception:
-                ltp = m.get("lastTradePrice")
-                prob = f"{float(ltp)*100:.1f}%" if ltp else "?"
-
-            volume = float(m.get("volumeNum") or m.get("volume") or 0)
-            liq = float(m.get("liquidityNum") or m.get("liquidity") or 0)
-
-            def fmt_usd(v):
-                if v >= 1_000_000:
-                    return f"${v/1_000_000:.1f}M"
-                if v >= 1_000:
-                    return f"${v/1_000:.0f}K"
-                return f"${v:.0f}"
-
-            end = (m.get("endDateIso") or m.get("end_date_iso", ""))[:10]
-
-            table.add_row(
-                question[:45],
-                prob,
-                fmt_usd(volume),
-                fmt_usd(liq),
-                end,
-            )
+        # Reuse cached rows; format all cache misses together in one vectorized batch
+        cache = self._row_cache
+        ids = [market_id(m) for m in markets]
+        keys = [market_key(m) for m in markets]
+        cells = [cache.lookup(mid, key) for mid, key in zip(ids, keys)]
+        misses = [i for i, c in enumerate(cells) if c is None]
+        if misses:
+            for i, row in zip(misses, _market_rows([markets[i] for i in misses])):
+                cells[i] = row
+                cache.put(ids[i], keys[i], row)
+        rows = {mid or f"#{i}": row for i, (mid, row) in enumerate(zip(ids, cells))}
+        sync_rows(table, self._columns, self._rows, rows)
+        self._rows = rows
+        return True
+
+    def on_show(self):
+        # Hidden tabs skip the periodic refresh: catch up now
+        self.run_worker(self.refresh_data(), exclusive=True, group="refresh")
+
+    async def refresh_data(self) -> bool:
+        """Reload the current listing (periodic app refresh)."""
+        return await self._load_markets(self._query)
 
     async def on_input_submitted(self, event: Input.Submitted):
+        self._query = event.value
         await self._load_markets(event.value)
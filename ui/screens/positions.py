@@ -1,11 +1,67 @@
 """
 Positions Screen - Active positions and trade history.
 """
+import asyncio
+from typing import Optional
+
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import DataTable, Label, Static, TabbedContent, TabPane
 
-from core.risk.portfolio import get_portfolio
+from core.risk.portfolio import PortfolioStats, get_portfolio
+from ui.formatting import PNL_COLOR, cached_cells, keyed_rows, sync_rows, truncate, watch_changes
+
+NO_POSITIONS = {"none": ("No open positions", "", "", "", "", "", "", "")}
+NO_TRADES = {"none": ("No trades yet", "", "", "", "", "", "", "")}
+
+
+def _position_row(pos) -> tuple:
+    key = (pos.shares, pos.avg_buy_price, pos.total_cost, pos.pnl, pos.status)
+    return cached_cells(pos, "positions", key, _format_position)
+
+
+def _trade_row(t) -> tuple:
+    return cached_cells(t, "positions", (), _format_trade)
+
+
+def _format_position(pos) -> tuple:
+    return (
+        truncate(pos.market_name, 25),
+        pos.outcome,
+        f"{pos.shares:.1f}",
+        f"${pos.avg_buy_price:.3f}",
+        f"${pos.total_cost:.2f}",
+        f"${pos.pnl:+.2f}",
+        pos.strategy,
+        pos.status,
+    )
+
+
+def _format_trade(t) -> tuple:
+    return (
+        t.timestamp[:19].replace("T", " "),
+        t.strategy,
+        truncate(t.market_name, 20),
+        t.side,
+        f"${t.price:.3f}",
+        f"{t.size:.1f}",
+        f"${t.total:.2f}",
+        t.status,
+    )
+
+
+# Summary bar fragments (rich Text, no markup to parse), in summary-key order; each
+# is rebuilt only when its value moves
+_SUMMARY_FIELDS = (
+    lambda n: Text(f"Open: {n}"),
+    lambda v: Text(f"Invested: ${v:.2f}"),
+    lambda v: Text.assemble("Daily: ", (f"${v:+.2f}", PNL_COLOR[v >= 0])),
+    lambda v: Text.assemble("Total: ", (f"${v:+.2f}", PNL_COLOR[v >= 0])),
+    lambda v: Text(f"Win Rate: {v:.0f}%"),
+    lambda n: Text(f"Trades: {n}"),
+)
+SUMMARY_SEP = Text("  |  ")
 
 
 class PositionsScreen(Widget):
@@ -33,6 +89,18 @@ class PositionsScreen(Widget):
     def __init__(self):
         super().__init__()
         self._portfolio = get_portfolio()
+        self._summary: Optional[Static] = None
+        self._active_table: Optional[DataTable] = None
+        self._history_table: Optional[DataTable] = None
+        self._shown = asyncio.Event()
+        self._last_snapshot = None
+        self._last_summary_key = None
+        self._summary_parts: list[Text] = [Text()] * len(_SUMMARY_FIELDS)
+        self._last_trade_seq = None
+        self._active_rows: dict[str, tuple] = {}
+        self._history_rows: dict[str, tuple] = {}
+        self._active_cols: list = []
+        self._history_cols: list = []
 
     def compose(self) -> ComposeResult:
         yield Static(id="portfolio-summary", classes="summary")
@@ -43,83 +111,90 @@ class PositionsScreen(Widget):
                 yield DataTable(id="history-table")
 
     async def on_mount(self):
+        self._summary = self.query_one("#portfolio-summary", Static)
+
         # Active positions table
-        active = self.query_one("#active-table", DataTable)
-        active.add_columns("Market", "Outcome", "Shares", "Avg Price", "Cost", "P&L", "Strategy", "Status")
+        self._active_table = self.query_one("#active-table", DataTable)
+        self._active_cols = self._active_table.add_columns("Market", "Outcome", "Shares", "Avg Price", "Cost", "P&L", "Strategy", "Status")
 
         # History table
-        hist = self.query_one("#history-table", DataTable)
-        hist.add_columns("Time", "Strategy", "Market", "Side", "Price", "Size", "Total", "Status")
+        self._history_table = self.query_one("#history-table", DataTable)
+        self._history_cols = self._history_table.add_columns("Time", "Strategy", "Market", "Side", "Price", "Size", "Total", "Status")
 
-        self._refresh()
+        await self._refresh()
+        self.run_worker(watch_changes(self._portfolio.changed, self._shown, self._schedule_refresh), group="watch")
 
     def on_show(self):
-        self._refresh()
-
-    def _refresh(self):
-        self._update_summary()
-        self._update_active()
-        self._update_history()
-
-    def _update_summary(self):
-        stats = self._portfolio.get_stats()
-        daily = stats["daily_pnl"]
-        total = stats["total_pnl"]
-        dc = "green" if daily >= 0 else "red"
-        tc = "green" if total >= 0 else "red"
-        text = (
-            f"Open: {stats['open_positions']}  |  "
-            f"Invested: ${stats['total_invested']:.2f}  |  "
-            f"Daily: [{dc}]${daily:+.2f}[/{dc}]  |  "
-            f"Total: [{tc}]${total:+.2f}[/{tc}]  |  "
-            f"Win Rate: {stats['win_rate']:.0f}%  |  "
-            f"Trades: {stats['total_trades']}"
+        self._shown.set()
+        self._schedule_refresh()
+
+    def on_hide(self):
+        self._shown.clear()
+
+    def _schedule_refresh(self):
+        self.run_worker(self._refresh(), exclusive=True, group="refresh")
+
+    async def _load(self) -> tuple[PortfolioStats, list, list, int]:
+        """
+        Read portfolio state off the UI loop:
+        (stats, open positions, recent trades, trade_seq those trades are as of).
+        """
+        portfolio = self._portfolio
+        seq = portfolio.trade_seq  # read first: the trades are at least this new
+        stats, positions, trades = await asyncio.gather(
+            asyncio.to_thread(portfolio.get_stats),
+            asyncio.to_thread(portfolio.get_open_positions),
+            asyncio.to_thread(portfolio.get_recent_trades, 100),
         )
-        try:
-            self.query_one("#portfolio-summary", Static).update(text)
-        except Exception:
-            pass
-
-    def _update_active(self):
-        table = self.query_one("#active-table", DataTable)
-        table.clear()
-        positions = self._portfolio.get_open_positions()
-
-        if not positions:
-            table.add_row("No open positions", "", "", "", "", "", "", "")
+        return stats, positions, trades, seq
+
+    async def refresh_data(self) -> bool:
+        """Periodic app refresh hook. Returns False if the portfolio is unchanged."""
+        stats, positions, trades, seq = await self._load()
+        snapshot = (
+            stats,
+            tuple((p.position_id, p.pnl, p.status) for p in positions),
+        )
+        if snapshot == self._last_snapshot:
+            return False
+        self._last_snapshot = snapshot
+        self._render(stats, positions, trades, seq)
+        return True
+
+    async def _refresh(self):
+        self._render(*await self._load())
+
+    def _render(self, stats: PortfolioStats, positions: list, trades: list, trade_seq: int):
+        self._update_summary(stats)
+        self._update_active(positions)
+        self._update_history(trades, trade_seq)
+
+    def _update_summary(self, stats: PortfolioStats):
+        # Values as displayed; skip the rebuild + repaint if none moved
+        key = (
+            stats.open_positions, round(stats.total_invested, 2), round(stats.daily_pnl, 2),
+            round(stats.total_pnl, 2), round(stats.win_rate), stats.total_trades,
+        )
+        prev = self._last_summary_key or (None,) * len(key)
+        if key == prev:
             return
-
-        for pos in positions:
-            pnl_str = f"${pos.pnl:+.2f}"
-            table.add_row(
-                pos.market_name[:25],
-                pos.outcome,
-                f"{pos.shares:.1f}",
-                f"${pos.avg_buy_price:.3f}",
-                f"${pos.total_cost:.2f}",
-                pnl_str,
-                pos.strategy,
-                pos.status,
-            )
-
-    def _update_history(self):
-        table = self.query_one("#history-table", DataTable)
-        table.clear()
-        trades = self._portfolio.get_recent_trades(limit=100)
-
-        if not trades:
-            table.add_row("No trades yet", "", "", "", "", "", "", "")
+        self._last_summary_key = key
+        parts = self._summary_parts
+        for i, build in enumerate(_SUMMARY_FIELDS):
+            if key[i] != prev[i]:
+                parts[i] = build(key[i])
+        self._summary.update(SUMMARY_SEP.join(parts))
+
+    def _update_active(self, positions: list):
+        rows = keyed_rows(positions, lambda p: p.position_id, _position_row) or NO_POSITIONS
+        sync_rows(self._active_table, self._active_cols, self._active_rows, rows)
+        self._active_rows = rows
+
+    def _update_history(self, trades: list, trade_seq: int):
+        # History only grows by new trades: nothing to do if none were recorded
+        if trade_seq == self._last_trade_seq:
             return
-
-        for t in reversed(trades):
-            ts = t.timestamp[:19].replace("T", " ")
-            table.add_row(
-                ts,
-                t.strategy,
-                t.market_name[:20],
-                t.side,
-                f"${t.price:.3f}",
-                f"{t.size:.1f}",
-                f"${t.total:.2f}",
-                t.status,
-            )
+        self._last_trade_seq = trade_seq
+        rows = keyed_rows(trades, lambda t: t.trade_id, _trade_row) or NO_TRADES
+        sync_rows(self._history_table, self._history_cols, self._history_rows, rows)
+        self._history_rows = rows
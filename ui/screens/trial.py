@@ -22,13 +22,64 @@ Layout:
 """
 import asyncio
 from datetime import datetime
+from typing import Optional
 
 import config as cfg
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import DataTable, Label, RichLog, Static
 
+from ui.formatting import PNL_COLOR, PNL_SIGN, cached_cells, keyed_rows, same_rows, sync_rows, truncate, watch_changes
+
+if cfg.PAPER_TRADE:
+    from core.paper_trading.wallet import WalletStats, get_paper_wallet
+else:
+    get_paper_wallet = None
+
+NO_POSITIONS = {"none": ("No open paper positions", "", "", "", "", "", "", "")}
+NO_TRADES = {"none": ("No paper trades yet — start a strategy!", "", "", "", "", "", "")}
+
+
+def _position_row(pos) -> tuple:
+    key = (pos.shares, pos.entry_price, pos.current_price, pos.pnl, pos.pnl_pct)
+    return cached_cells(pos, "trial", key, _format_position)
+
+
+def _trade_row(t) -> tuple:
+    return cached_cells(t, "trial", (), _format_trade)
+
+
+def _format_position(pos) -> tuple:
+    return (
+        truncate(pos.market_name, 28),
+        pos.outcome,
+        f"{pos.shares:.0f}x",
+        f"${pos.entry_price:.3f}",
+        f"${pos.current_price:.3f}" if pos.current_price > 0 else "...",
+        f"${pos.pnl:+.2f}",
+        f"{pos.pnl_pct:+.1f}%",
+        pos.strategy,
+    )
+
+
+def _format_trade(t) -> tuple:
+    return (
+        t.timestamp[11:19],  # HH:MM:SS only
+        t.strategy,
+        truncate(t.market_name, 25),
+        t.side,
+        f"${t.price:.3f}",
+        f"{t.shares:.0f}",
+        f"${t.total:.2f}",
+    )
+
+
+# Refreshes are driven by wallet change events; this slow poll is only a backstop
+FALLBACK_REFRESH = 300
+
 
 class TrialScreen(Widget):
     """Paper trading performance dashboard with real-time P&L."""
@@ -81,7 +132,20 @@ class TrialScreen(Widget):
     def __init__(self):
         super().__init__()
         self._wallet = None
+        self._stats_bar: Optional[Static] = None
+        self._open_table: Optional[DataTable] = None
+        self._history_table: Optional[DataTable] = None
+        # Fallback timer and wallet watcher only run while the screen is visible
+        self._timer: Optional[Timer] = None
+        self._shown = asyncio.Event()
         self._last_refresh = None
+        self._last_stats_key = None
+        self._last_trade_seq = None
+        self._last_open_version = None  # (prices_version, trade_seq) of the open table
+        self._open_rows: dict[str, tuple] = {}
+        self._history_rows: dict[str, tuple] = {}
+        self._open_cols: list = []
+        self._history_cols: list = []
 
     def compose(self) -> ComposeResult:
         if not cfg.PAPER_TRADE:
@@ -94,7 +158,7 @@ class TrialScreen(Widget):
         yield Static(" PAPER TRADING MODE — Virtual $50 Account ", classes="trial-header")
         yield Static(id="stats-bar", classes="stats-bar")
 
-        yield Static(" OPEN POSITIONS (P&L from real prices, refreshes every 30s) ", classes="section-title")
+        yield Static(" OPEN POSITIONS (P&L from real prices, updates live) ", classes="section-title")
         yield DataTable(id="open-table")
 
         yield Static(" TRADE HISTORY ", classes="section-title")
@@ -104,103 +168,112 @@ class TrialScreen(Widget):
         if not cfg.PAPER_TRADE:
             return
 
-        try:
-            from core.paper_trading.wallet import get_paper_wallet
-            self._wallet = get_paper_wallet()
-        except Exception:
-            pass
+        self._wallet = get_paper_wallet()
+
+        self._stats_bar = self.query_one("#stats-bar", Static)
 
         # Setup tables
-        open_t = self.query_one("#open-table", DataTable)
-        open_t.add_columns("Market", "Side", "Shares", "Entry", "Current", "P&L", "P&L%", "Strategy")
+        self._open_table = self.query_one("#open-table", DataTable)
+        self._open_cols = self._open_table.add_columns("Market", "Side", "Shares", "Entry", "Current", "P&L", "P&L%", "Strategy")
 
-        hist_t = self.query_one("#history-table", DataTable)
-        hist_t.add_columns("Time", "Strategy", "Market", "Side", "Price", "Shares", "Total")
+        self._history_table = self.query_one("#history-table", DataTable)
+        self._history_cols = self._history_table.add_columns("Time", "Strategy", "Market", "Side", "Price", "Shares", "Total")
 
-        self._refresh_display()
-        # Auto-refresh every 30s
-        self.set_interval(30, self._refresh_display)
+        await self._refresh_display()
+        if self._wallet:
+            self.run_worker(watch_changes(self._wallet.changed, self._shown, self._schedule_refresh), group="watch")
+        self._timer = self.set_interval(FALLBACK_REFRESH, self._schedule_refresh, pause=not self._shown.is_set())
 
     def on_show(self):
-        self._refresh_display()
+        self._shown.set()
+        if self._timer:
+            self._timer.resume()
+        self._schedule_refresh()
+
+    def on_hide(self):
+        self._shown.clear()
+        if self._timer:
+            self._timer.pause()
+
+    def _schedule_refresh(self):
+        self.run_worker(self._refresh_display(), exclusive=True, group="refresh")
 
-    def _refresh_display(self):
+    async def _refresh_display(self):
         if not self._wallet:
             return
-        self._update_stats()
-        self._update_open_positions()
-        self._update_history()
-        self._last_refresh = datetime.now().strftime("%H:%M:%S")
+        wallet = self._wallet
+        trade_seq = wallet.trade_seq
+        open_version = (wallet.prices_version, trade_seq)
+        # Wallet reads (win rate is O(trades^2)) run off the UI loop
+        stats, positions, trades = await asyncio.gather(
+            asyncio.to_thread(wallet.get_stats),
+            asyncio.to_thread(lambda: wallet.open_positions),
+            asyncio.to_thread(wallet.get_recent_trades, 30),
+        )
+        tables_changed = self._update_open_positions(positions, open_version)
+        tables_changed = self._update_history(trades, trade_seq) or tables_changed
+        self._update_stats(stats, tables_changed)
 
-    def _update_stats(self):
-        stats = self._wallet.get_stats()
-        balance = stats["balance"]
-        total_pnl = stats["total_pnl"]
-        ret_pct = stats["total_return_pct"]
-        win_rate = stats["win_rate"]
-        n_open = stats["open_positions"]
-        n_trades = stats["trade_count"]
-        unrealized = stats["unrealized_pnl"]
-        realized = stats["realized_pnl"]
-
-        bal_color = "green" if balance >= cfg.PAPER_STARTING_BALANCE else "red"
-        pnl_color = "green" if total_pnl >= 0 else "red"
-        sign = "+" if total_pnl >= 0 else ""
-
-        text = (
-            f"[bold]Balance:[/bold] [{bal_color}]${balance:.2f}[/{bal_color}]  |  "
-            f"[bold]Total P&L:[/bold] [{pnl_color}]{sign}${total_pnl:.2f} ({ret_pct:+.1f}%)[/{pnl_color}]  |  "
-            f"[bold]Realized:[/bold] ${realized:+.2f}  "
-            f"[bold]Unrealized:[/bold] ${unrealized:+.2f}  |  "
-            f"[bold]Win Rate:[/bold] {win_rate:.0f}%  "
-            f"[bold]Trades:[/bold] {n_trades}  "
-            f"[bold]Open:[/bold] {n_open}  |  "
-            f"[dim]Updated: {self._last_refresh or '--:--:--'}[/dim]"
+    def _update_stats(self, stats: "WalletStats", tables_changed: bool = False) -> bool:
+        """
+        Redraw the stats bar if its values (or the tables) changed, stamping
+        the time of that update. Returns False if nothing was redrawn.
+        """
+        balance = stats.balance
+        total_pnl = stats.total_pnl
+        ret_pct = stats.total_return_pct
+        win_rate = stats.win_rate
+        n_open = stats.open_positions
+        n_trades = stats.trade_count
+        unrealized = stats.unrealized_pnl
+        realized = stats.realized_pnl
+        key = (
+            round(balance, 2), round(total_pnl, 2), round(ret_pct, 1), round(win_rate),
+            n_open, n_trades, round(unrealized, 2), round(realized, 2),
         )
-        try:
-            self.query_one("#stats-bar", Static).update(text)
-        except Exception:
-            pass
-
-    def _update_open_positions(self):
-        table = self.query_one("#open-table", DataTable)
-        table.clear()
-        if not self._wallet.open_positions:
-            table.add_row("No open paper positions", "", "", "", "", "", "", "")
-            return
+        if key == self._last_stats_key and not tables_changed:
+            return False
+        self._last_stats_key = key
+        # "Updated" is when something last changed, not the last poll
+        self._last_refresh = datetime.now().strftime("%H:%M:%S")
 
-        for pos in self._wallet.open_positions:
-            pnl_color = "green" if pos.pnl >= 0 else "red"
-            pnl_str = f"${pos.pnl:+.2f}"
-            pct_str = f"{pos.pnl_pct:+.1f}%"
-            current = f"${pos.current_price:.3f}" if pos.current_price > 0 else "..."
-            table.add_row(
-                pos.market_name[:28],
-                pos.outcome,
-                f"{pos.shares:.0f}x",
-                f"${pos.entry_price:.3f}",
-                current,
-                pnl_str,
-                pct_str,
-                pos.strategy,
-            )
+        bal_color = PNL_COLOR[balance >= cfg.PAPER_STARTING_BALANCE]
+        pnl_color = PNL_COLOR[total_pnl >= 0]
+        sign = PNL_SIGN[total_pnl >= 0]
 
-    def _update_history(self):
-        table = self.query_one("#history-table", DataTable)
-        table.clear()
-        trades = self._wallet.get_recent_trades(limit=30)
-        if not trades:
-            table.add_row("No paper trades yet — start a strategy!", "", "", "", "", "", "")
-            return
+        # Styled spans instead of markup: Static.update skips the markup parser
+        text = Text.assemble(
+            ("Balance: ", "bold"), (f"${balance:.2f}", bal_color), "  |  ",
+            ("Total P&L: ", "bold"), (f"{sign}${total_pnl:.2f} ({ret_pct:+.1f}%)", pnl_color), "  |  ",
+            ("Realized: ", "bold"), f"${realized:+.2f}  ",
+            ("Unrealized: ", "bold"), f"${unrealized:+.2f}  |  ",
+            ("Win Rate: ", "bold"), f"{win_rate:.0f}%  ",
+            ("Trades: ", "bold"), f"{n_trades}  ",
+            ("Open: ", "bold"), f"{n_open}  |  ",
+            (f"Updated: {self._last_refresh}", "dim"),
+        )
+        self._stats_bar.update(text)
+        return True
 
-        for t in trades:
-            ts = t.timestamp[11:19]  # HH:MM:SS only
-            table.add_row(
-                ts,
-                t.strategy,
-                t.market_name[:25],
-                t.side,
-                f"${t.price:.3f}",
-                f"{t.shares:.0f}",
-                f"${t.total:.2f}",
-            )
+    def _update_open_positions(self, positions: list, version: tuple) -> bool:
+        # Open positions only move on a price tick or a trade
+        if version == self._last_open_version:
+            return False
+        self._last_open_version = version
+        rows = keyed_rows(positions, lambda p: p.position_id, _position_row) or NO_POSITIONS
+        if same_rows(self._open_rows, rows):
+            return False
+        sync_rows(self._open_table, self._open_cols, self._open_rows, rows)
+        self._open_rows = rows
+        return True
+
+    def _update_history(self, trades: list, trade_seq: int) -> bool:
+        if trade_seq == self._last_trade_seq:
+            return False
+        self._last_trade_seq = trade_seq
+        rows = keyed_rows(trades, lambda t: t.trade_id, _trade_row) or NO_TRADES
+        if same_rows(self._history_rows, rows):
+            return False
+        sync_rows(self._history_table, self._history_cols, self._history_rows, rows)
+        self._history_rows = rows
+        return True